@@ -1,4 +1,5 @@
 import base64
+import functools
 import mimetypes
 from pathlib import Path
 from typing import Protocol
@@ -8,6 +9,52 @@ from coreason_identity.models import UserContext
 
 from coreason_sandbox.models import FileReference
 
+# Common artifact types resolved without touching the mimetypes database
+_FAST_MIME: dict[str, str] = {
+    ".txt": "text/plain",
+    ".csv": "text/csv",
+    ".html": "text/html",
+    ".json": "application/json",
+    ".pdf": "application/pdf",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".svg": "image/svg+xml",
+}
+
+
+def _suffix_key(filename: str) -> str:
+    """Return the lower-cased suffix used to resolve a filename's MIME type.
+
+    An encoding suffix such as '.gz' is kept together with the one before it,
+    so 'report.tar.gz' maps to '.tar.gz' the way mimetypes reads it.
+
+    Args:
+        filename: The artifact filename.
+
+    Returns:
+        str: The suffix key (e.g. '.csv', '.tar.gz'), or '' if there is none.
+    """
+    suffixes = [suffix.lower() for suffix in Path(filename).suffixes]
+    if len(suffixes) > 1 and suffixes[-1] in mimetypes.encodings_map:
+        return "".join(suffixes[-2:])
+    return suffixes[-1] if suffixes else ""
+
+
+@functools.lru_cache(maxsize=256)
+def _guess_content_type(suffix: str) -> str:
+    """Resolve a MIME type missing from _FAST_MIME, caching the lookup per suffix.
+
+    Args:
+        suffix: The key returned by _suffix_key (e.g. '.csv').
+
+    Returns:
+        str: The guessed MIME type, or 'application/octet-stream' if unknown.
+    """
+    mime_type, _ = mimetypes.guess_type(f"file{suffix}")
+    return mime_type or "application/octet-stream"
+
 
 class ObjectStorage(Protocol):
     """Protocol for object storage backends (e.g., S3)."""
@@ -61,9 +108,8 @@ class ArtifactManager:
         if not file_path.exists():
             raise FileNotFoundError(f"Artifact file not found: {file_path}")  # pragma: no cover
 
-        mime_type, _ = mimetypes.guess_type(original_filename)
-        if not mime_type:
-            mime_type = "application/octet-stream"  # pragma: no cover
+        suffix = _suffix_key(original_filename)
+        mime_type = _FAST_MIME.get(suffix) or _guess_content_type(suffix)
 
         file_ref = FileReference(
             filename=original_filename,
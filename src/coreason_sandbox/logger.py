@@ -19,34 +19,44 @@ from pathlib import Path
 
 from loguru import logger
 
-__all__ = ["logger"]
-
-# Remove default handler
-logger.remove()
-
-# Sink 1: Stdout (Human-readable)
-logger.add(
-    sys.stderr,
-    level="INFO",
-    format=(
-        "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-        "<level>{level: <8}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-        "<level>{message}</level>"
-    ),
-)
-
-# Ensure logs directory exists
-log_path = Path("logs")
-if not log_path.exists():
-    log_path.mkdir(parents=True, exist_ok=True)  # pragma: no cover
-
-# Sink 2: File (JSON, Rotation, Retention)
-logger.add(
-    "logs/app.log",
-    rotation="500 MB",
-    retention="10 days",
-    serialize=True,
-    enqueue=True,
-    level="INFO",
-)
+__all__ = ["logger", "setup_logger"]
+
+
+def setup_logger(log_dir: Path = Path("logs")) -> None:
+    """Configure the loguru sinks, replacing any existing handlers.
+
+    Safe to call repeatedly; each call leaves exactly one stderr sink and one file sink.
+
+    Args:
+        log_dir: Directory for the rotated JSON log file (default: 'logs').
+    """
+    # Remove default (or previously configured) handlers
+    logger.remove()
+
+    # Sink 1: Stdout (Human-readable)
+    logger.add(
+        sys.stderr,
+        level="INFO",
+        format=(
+            "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+            "<level>{level: <8}</level> | "
+            "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+            "<level>{message}</level>"
+        ),
+    )
+
+    # Ensure logs directory exists
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    # Sink 2: File (JSON, Rotation, Retention)
+    logger.add(
+        log_dir / "app.log",
+        rotation="500 MB",
+        retention="10 days",
+        serialize=True,
+        enqueue=True,
+        level="INFO",
+    )
+
+
+setup_logger()
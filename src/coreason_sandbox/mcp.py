@@ -11,7 +11,7 @@
 import asyncio
 import time
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Literal
+from typing import Any, AsyncIterator, Callable, Literal
 
 from coreason_identity.models import UserContext
 from loguru import logger
@@ -28,16 +28,17 @@ class SandboxMCP:
     SessionManager.
     """
 
-    def __init__(self, config: SandboxConfig | None = None):
+    def __init__(self, config: SandboxConfig | None = None, clock: Callable[[], float] = time.time):
         """Initializes the SandboxMCP.
 
         Args:
             config: Optional configuration object. If not provided, defaults are used.
+            clock: Source of timestamps for session expiry, passed to SessionManager (default: time.time).
         """
         self.config = config or SandboxConfig()
 
         self.veritas = VeritasIntegrator(enabled=self.config.enable_audit_logging)
-        self.session_manager = SessionManager(self.config)
+        self.session_manager = SessionManager(self.config, clock=clock)
 
     @property
     def sessions(self) -> dict[str, Session]:
@@ -85,7 +86,7 @@ class SandboxMCP:
                     yield session
                 finally:
                     # Update access time after execution
-                    session.last_accessed = time.time()
+                    session.last_accessed = self.session_manager.clock()
                 break
 
     async def execute_code(
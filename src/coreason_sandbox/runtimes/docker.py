@@ -37,6 +37,7 @@ class DockerRuntime(SandboxRuntime):
         allowed_packages: set[str] | None = None,
         timeout: float = 60.0,
         artifact_manager: ArtifactManager | None = None,
+        client: docker.DockerClient | None = None,
     ):
         """Initializes the DockerRuntime.
 
@@ -47,8 +48,9 @@ class DockerRuntime(SandboxRuntime):
             allowed_packages: Set of allowed Python packages.
             timeout: Execution timeout in seconds.
             artifact_manager: Manager for processing artifacts.
+            client: Docker client to reuse. Defaults to one built from the environment.
         """
-        self.client = docker.from_env()
+        self.client = client if client is not None else docker.from_env()
         self.image = image
         self.cpu_limit = cpu_limit
         self.mem_limit = mem_limit
@@ -69,7 +71,9 @@ class DockerRuntime(SandboxRuntime):
         """
         logger.info(f"Starting Docker sandbox with image {self.image}")
         try:
-            self.container = self.client.containers.run(
+            # Offload the blocking Docker API calls so several runtimes can start concurrently
+            container = await asyncio.to_thread(
+                self.client.containers.run,
                 self.image,
                 command="tail -f /dev/null",
                 detach=True,
@@ -79,10 +83,11 @@ class DockerRuntime(SandboxRuntime):
                 remove=True,
                 working_dir=self.work_dir,
             )
+            self.container = container
             # Ensure working directory exists
-            self.container.exec_run(f"mkdir -p {self.work_dir}")
+            await asyncio.to_thread(container.exec_run, f"mkdir -p {self.work_dir}")
 
-            logger.info(f"Docker sandbox started: {self.container.short_id}")
+            logger.info(f"Docker sandbox started: {container.short_id}")
         except DockerException as e:
             logger.error(f"Failed to start Docker sandbox: {e}")
             raise
@@ -126,7 +131,7 @@ class DockerRuntime(SandboxRuntime):
         if not path.startswith("/"):
             path = f"{self.work_dir}/{path}"
 
-        exit_code, output = self.container.exec_run(f"ls -1 {path}")
+        exit_code, output = await asyncio.to_thread(self.container.exec_run, f"ls -1 {path}")
         if exit_code != 0:
             # Could be not found or error
             stderr = output.decode("utf-8") if output else "Unknown error"
@@ -245,9 +250,9 @@ class DockerRuntime(SandboxRuntime):
 
         # 2. Upload wheels to container
         remote_pkg_dir = f"/tmp/packages/{package_name}"
-        self.container.exec_run(f"mkdir -p {remote_pkg_dir}")
+        await asyncio.to_thread(self.container.exec_run, f"mkdir -p {remote_pkg_dir}")
 
-        self.container.put_archive(path=remote_pkg_dir, data=tar_bytes)
+        await asyncio.to_thread(self.container.put_archive, path=remote_pkg_dir, data=tar_bytes)
 
         # 3. Install offline
         cmd = [
@@ -258,7 +263,7 @@ class DockerRuntime(SandboxRuntime):
             remote_pkg_dir,
             package_name,
         ]
-        exit_code, output = self.container.exec_run(cmd)
+        exit_code, output = await asyncio.to_thread(self.container.exec_run, cmd)
         if exit_code != 0:
             msg = output.decode("utf-8")
             logger.error(f"Failed to install {package_name} in container: {msg}")
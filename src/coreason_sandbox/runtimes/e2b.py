@@ -351,12 +351,12 @@ class E2BRuntime(SandboxRuntime):
     async def terminate(self) -> None:
         """Kill and cleanup the sandbox environment.
 
-        Closes the E2B sandbox session.
+        Kills the E2B sandbox session.
         """
         if self.sandbox:
             logger.info(f"Terminating E2B sandbox: {self.sandbox.sandbox_id}")
             try:
-                await asyncio.to_thread(self.sandbox.close)
+                await asyncio.to_thread(self.sandbox.kill)
             except Exception as e:
                 logger.warning(f"Error terminating E2B sandbox: {e}")
             finally:
@@ -11,6 +11,7 @@
 import asyncio
 import time
 from dataclasses import dataclass, field
+from typing import Awaitable, Callable
 
 from coreason_identity.models import UserContext
 from loguru import logger
@@ -36,15 +37,21 @@ class SessionManager:
     Uses a background reaper task to terminate expired sessions.
     """
 
-    def __init__(self, config: SandboxConfig | None = None):
+    def __init__(self, config: SandboxConfig | None = None, clock: Callable[[], float] = time.time):
         """Initializes the SessionManager.
 
         Args:
             config: Optional configuration object. If not provided, defaults are used.
+            clock: Source of timestamps for session access and expiry (default: time.time).
         """
         self.config = config or SandboxConfig()
+        self.clock = clock
         self.sessions: dict[str, Session] = {}
         self._reaper_task: asyncio.Task[None] | None = None
+        # Per-instance so tests can stub the reaper's wait without touching asyncio.sleep globally
+        self._sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+        # Set after every reaper pass so callers can wait on a sweep instead of sleeping
+        self._cycle_event = asyncio.Event()
         self._creation_lock = asyncio.Lock()
 
     async def get_or_create_session(self, session_id: str, context: UserContext) -> Session:
@@ -77,7 +84,7 @@ class SessionManager:
             if session.owner_id != context.user_id:
                 logger.warning(f"Unauthorized access attempt to session {session_id} by {context.user_id}")
                 raise PermissionError(f"Session {session_id} does not belong to user {context.user_id}")
-            session.last_accessed = time.time()
+            session.last_accessed = self.clock()
             return session
 
         async with self._creation_lock:
@@ -87,7 +94,7 @@ class SessionManager:
                 if session.owner_id != context.user_id:
                     logger.warning(f"Unauthorized access attempt to session {session_id} by {context.user_id}")
                     raise PermissionError(f"Session {session_id} does not belong to user {context.user_id}")
-                session.last_accessed = time.time()
+                session.last_accessed = self.clock()
                 return session
 
             runtime = SandboxFactory.get_runtime(self.config)
@@ -102,7 +109,7 @@ class SessionManager:
 
             session = Session(
                 runtime=runtime,
-                last_accessed=time.time(),
+                last_accessed=self.clock(),
                 owner_id=context.user_id,
             )
             self.sessions[session_id] = session
@@ -116,34 +123,40 @@ class SessionManager:
         if self._reaper_task is None or self._reaper_task.done():
             self._reaper_task = asyncio.create_task(self._reaper_loop())
 
+    async def _reap_once(self) -> None:
+        """Run a single reaper sweep.
+
+        Terminates every session that has been idle for longer than the
+        configured idle timeout.
+        """
+        now = self.clock()
+        # Create a list of sessions to terminate to avoid modifying dict while iterating
+        expired_ids = [
+            sid for sid, session in self.sessions.items() if now - session.last_accessed > self.config.idle_timeout
+        ]
+
+        for sid in expired_ids:
+            logger.info(f"Session {sid} expired. Terminating.")
+            session = self.sessions.pop(sid, None)
+            if session:
+                async with session.lock:
+                    session.active = False
+                    try:
+                        await session.runtime.terminate()
+                    except Exception as e:
+                        logger.error(f"Error terminating expired session {sid}: {e}")
+
     async def _reaper_loop(self) -> None:
         """Background task to cleanup expired sessions.
 
-        Periodically checks for and terminates sessions that have exceeded the
-        idle timeout.
+        Runs _reap_once() every reaper_interval seconds until cancelled.
         """
         logger.info("Session reaper started")
         try:
             while True:
-                await asyncio.sleep(self.config.reaper_interval)
-                now = time.time()
-                # Create a list of sessions to terminate to avoid modifying dict while iterating
-                expired_ids = [
-                    sid
-                    for sid, session in self.sessions.items()
-                    if now - session.last_accessed > self.config.idle_timeout
-                ]
-
-                for sid in expired_ids:
-                    logger.info(f"Session {sid} expired. Terminating.")
-                    session = self.sessions.pop(sid, None)
-                    if session:
-                        async with session.lock:
-                            session.active = False
-                            try:
-                                await session.runtime.terminate()
-                            except Exception as e:
-                                logger.error(f"Error terminating expired session {sid}: {e}")
+                await self._sleep(self.config.reaper_interval)
+                await self._reap_once()
+                self._cycle_event.set()
 
         except asyncio.CancelledError:
             logger.info("Session reaper cancelled")
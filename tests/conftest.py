@@ -1,45 +1,358 @@
-from typing import Any, Generator
-from unittest.mock import MagicMock, patch
+import asyncio
+import base64
+import functools
+import os
+from collections import deque
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncGenerator, AsyncIterator, Generator, Literal
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import docker
 import pytest
+import pytest_asyncio
 from coreason_identity.models import UserContext
+from coreason_sandbox.logger import logger
+from coreason_sandbox.mcp import SandboxMCP
+from coreason_sandbox.models import ExecutionResult
+from coreason_sandbox.runtime import SandboxRuntime
+from coreason_sandbox.runtimes.docker import DockerRuntime
+from coreason_sandbox.session_manager import SessionManager
 
+# Default result for mocked executions; trusted test data, so built once without validation
+_EMPTY_RESULT = ExecutionResult.model_construct(stdout="", stderr="", exit_code=0, artifacts=[], execution_duration=0.1)
 
-@pytest.fixture
-def mock_ier_logger() -> Generator[Any, None, None]:
-    mock_module = MagicMock()
-    mock_logger_class = MagicMock()
-    mock_module.IERLogger = mock_logger_class
 
-    with patch.dict("sys.modules", {"coreason_veritas.auditor": mock_module}):
-        with patch("coreason_sandbox.integrations.veritas.IERLogger", mock_logger_class):
-            yield mock_logger_class
+@pytest.fixture(scope="module")
+def _runtime_template() -> AsyncMock:
+    return AsyncMock(spec_set=SandboxRuntime)
 
 
 @pytest.fixture
-def mock_vault_client() -> Generator[Any, None, None]:
-    mock_module = MagicMock()
-    mock_client_class = MagicMock()
-    mock_module.VaultClient = mock_client_class
+def mock_runtime(_runtime_template: AsyncMock) -> AsyncMock:
+    """The module's runtime mock, reset and returning an empty result for each test."""
+    _runtime_template.reset_mock(return_value=True, side_effect=True)
+    _runtime_template.execute.return_value = _EMPTY_RESULT
+    return _runtime_template
+
 
-    with patch.dict("sys.modules", {"coreason_vault": mock_module}):
-        yield mock_client_class
+@pytest.fixture(scope="module")
+def _patched_get_runtime() -> Generator[MagicMock, None, None]:
+    # Patched once per module; mock_factory re-points it at each test's runtime
+    with patch("coreason_sandbox.session_manager.SandboxFactory.get_runtime") as mock:
+        yield mock
 
 
 @pytest.fixture
-def mock_veritas_integrator() -> Generator[Any, None, None]:
-    with patch("coreason_sandbox.mcp.VeritasIntegrator") as mock:
-        instance = mock.return_value
-        instance.log_pre_execution = MagicMock()
+def mock_factory(_patched_get_runtime: MagicMock, mock_runtime: Any) -> MagicMock:
+    _patched_get_runtime.reset_mock(return_value=True, side_effect=True)
+    _patched_get_runtime.return_value = mock_runtime
+    return _patched_get_runtime
+
+
+@pytest.fixture(scope="module")
+def _patched_veritas() -> Generator[MagicMock, None, None]:
+    # autospec gives the instance an AsyncMock log_pre_execution matching the real signature
+    with patch("coreason_sandbox.mcp.VeritasIntegrator", autospec=True) as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_vault_integrator() -> Generator[Any, None, None]:
-    with patch("coreason_sandbox.config.VaultIntegrator") as mock:
-        yield mock
+def mock_veritas(_patched_veritas: MagicMock) -> MagicMock:
+    """VeritasIntegrator as seen by SandboxMCP, patched once per module and reset for each test."""
+    _patched_veritas.reset_mock()
+    return _patched_veritas
+
+
+async def _skip_reaper(self: SessionManager) -> None:
+    return None
+
+
+@pytest.fixture(scope="module")
+def no_reaper() -> Generator[None, None, None]:
+    """Keep sessions from starting the background reaper task.
+
+    Modules whose tests never exercise idle-session reaping opt in via
+    ``pytestmark = pytest.mark.usefixtures("no_reaper")``, so no reaper task is
+    started or torn down per test.
+    """
+    # A plain coroutine: nothing asserts on these calls, so AsyncMock's bookkeeping isn't needed
+    with patch.object(SessionManager, "_start_reaper_if_needed", new=_skip_reaper):
+        yield
+
+
+@pytest.fixture
+def session_logger(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Swap the session manager's logger for a mock in tests that drive it down error paths."""
+    mock = MagicMock()
+    monkeypatch.setattr("coreason_sandbox.session_manager.logger", mock)
+    return mock
+
+
+class WatchedLock(asyncio.Lock):
+    """asyncio.Lock that signals each time a caller has to queue behind the holder."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.contended = 0
+        self._queued = asyncio.Event()
+
+    async def acquire(self) -> Literal[True]:
+        if self.locked():
+            self.contended += 1
+            self._queued.set()
+        return await super().acquire()
+
+    async def wait_for_waiters(self, count: int = 1) -> None:
+        """Yield until `count` callers have queued on the lock, failing after a second."""
+
+        async def _wait() -> None:
+            while self.contended < count:
+                self._queued.clear()
+                await self._queued.wait()
+
+        await asyncio.wait_for(_wait(), 1.0)
+
+
+@pytest.fixture
+def watched_lock() -> WatchedLock:
+    """A fresh WatchedLock for tests to install as a creation or session lock."""
+    return WatchedLock()
+
+
+class FakeClock:
+    """Stand-in for time.time that only moves when a test advances `now`."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_clock() -> FakeClock:
+    return FakeClock()
+
+
+class FakeRuntime(SandboxRuntime):
+    """
+    Plain async stand-in for a runtime, far cheaper than AsyncMock.
+    Records each call as a (method, *args) tuple in `calls` and returns preset values.
+    """
+
+    def __init__(self, result: ExecutionResult = _EMPTY_RESULT, files: list[str] | None = None) -> None:
+        self.result = result
+        self.files = files if files is not None else []
+        self.calls: list[tuple[Any, ...]] = []
+
+    def called(self, method: str) -> int:
+        """How many times `method` was awaited."""
+        return sum(1 for name, *_ in self.calls if name == method)
+
+    async def start(self) -> None:
+        self.calls.append(("start",))
+
+    async def execute(
+        self, code: str, language: Literal["python", "bash", "r"], context: UserContext, session_id: str
+    ) -> ExecutionResult:
+        self.calls.append(("execute", code, language, context, session_id))
+        return self.result
+
+    async def upload(self, local_path: Path, remote_path: str, context: UserContext, session_id: str) -> None:
+        self.calls.append(("upload", local_path, remote_path, context, session_id))
+
+    async def download(self, remote_path: str, local_path: Path, context: UserContext, session_id: str) -> None:
+        self.calls.append(("download", remote_path, local_path, context, session_id))
+
+    async def install_package(self, package_name: str, context: UserContext, session_id: str) -> None:
+        self.calls.append(("install_package", package_name, context, session_id))
+
+    async def list_files(self, path: str, context: UserContext, session_id: str) -> list[str]:
+        self.calls.append(("list_files", path, context, session_id))
+        return self.files
+
+    async def terminate(self) -> None:
+        self.calls.append(("terminate",))
+
+
+@pytest.fixture
+def fake_runtime() -> FakeRuntime:
+    return FakeRuntime()
+
+
+# What the Sandbox facade tests expect back from their runtime
+_SANDBOX_RESULT = ExecutionResult.model_construct(
+    stdout="out", stderr="", exit_code=0, execution_duration=0.1, artifacts=[]
+)
+
+
+@pytest.fixture
+def sandbox_runtime(monkeypatch: pytest.MonkeyPatch) -> FakeRuntime:
+    """Runtime stub that SandboxFactory hands to every Sandbox/SandboxAsync built in the test."""
+    runtime = FakeRuntime(result=_SANDBOX_RESULT, files=["file1", "file2"])
+    monkeypatch.setattr("coreason_sandbox.sandbox.SandboxFactory.get_runtime", lambda config: runtime)
+    return runtime
+
+
+@pytest_asyncio.fixture
+async def fresh_mcp(fake_clock: FakeClock) -> AsyncGenerator[SandboxMCP, None]:
+    """A default-configured SandboxMCP on the fake clock, shut down after the test."""
+    mcp = SandboxMCP(clock=fake_clock)
+    yield mcp
+    await mcp.shutdown()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def _module_mcp() -> AsyncGenerator[SandboxMCP, None]:
+    mcp = SandboxMCP()
+    yield mcp
+    await mcp.shutdown()
 
 
 @pytest.fixture
+def mcp_instance(_module_mcp: SandboxMCP) -> Generator[SandboxMCP, None, None]:
+    """A SandboxMCP built once per module; sessions a test opens are dropped afterwards.
+
+    Use fresh_mcp instead where a test needs the fake clock or inspects shutdown.
+    """
+    yield _module_mcp
+    _module_mcp.sessions.clear()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _quiet_logger() -> None:
+    """Drop the sinks installed at import so tests skip stderr formatting and the enqueued JSON file writer."""
+    logger.remove()
+
+
+@pytest.fixture(scope="session")
 def mock_user_context() -> UserContext:
+    # UserContext is a frozen model, so one instance can be shared safely
     return UserContext(user_id="test-user", email="test@example.com", scopes=["tester"])
+
+
+@pytest.fixture(scope="module")
+def image_artifact() -> tuple[bytes, str, str]:
+    """Raw bytes, base64 payload and PNG data URL for image artifact tests."""
+    img_bytes = b"fake_image_data"
+    b64_img = base64.b64encode(img_bytes).decode("utf-8")
+    return img_bytes, b64_img, f"data:image/png;base64,{b64_img}"
+
+
+@functools.cache
+def _docker_unavailable_reason() -> str | None:
+    """Probe the Docker daemon once per process; returns why it is unusable, or None."""
+    try:
+        docker.from_env().ping()
+    except docker.errors.DockerException as e:
+        return f"Docker daemon unreachable (Environment Issue): {e}"
+    return None
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    live_items = [item for item in items if item.get_closest_marker("live")]
+    if not live_items:
+        return
+    reason = _docker_unavailable_reason()
+    if reason is not None:
+        skip_live = pytest.mark.skip(reason=reason)
+        for item in live_items:
+            item.add_marker(skip_live)
+
+
+@pytest.fixture(scope="session")
+def docker_client() -> docker.DockerClient:
+    """One Docker client shared by all live tests; skips them if the daemon is unreachable."""
+    reason = _docker_unavailable_reason()
+    if reason is not None:
+        pytest.skip(reason)
+    return docker.from_env()
+
+
+LIVE_IMAGE = "python:3.12-slim"
+# Saved images live here so CI can cache them between runs instead of pulling from the registry.
+IMAGE_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "docker"
+
+
+@pytest.fixture(scope="session")
+def live_image(docker_client: docker.DockerClient) -> str:
+    """Make the live test image available locally, preferring a saved tarball over a registry pull."""
+    tarball = IMAGE_CACHE_DIR / f"{LIVE_IMAGE.replace(':', '-')}.tar"
+    try:
+        docker_client.images.get(LIVE_IMAGE)
+    except docker.errors.ImageNotFound:
+        try:
+            if tarball.exists():
+                with tarball.open("rb") as f:
+                    docker_client.images.load(f)
+            else:
+                image = docker_client.images.pull(LIVE_IMAGE)
+                tarball.parent.mkdir(parents=True, exist_ok=True)
+                # Write per xdist worker and rename, so parallel workers never see a partial tarball
+                partial = tarball.with_name(f"{tarball.name}.{os.environ.get('PYTEST_XDIST_WORKER', 'main')}")
+                with partial.open("wb") as f:
+                    for chunk in image.save(named=True):
+                        f.write(chunk)
+                os.replace(partial, tarball)
+        except docker.errors.DockerException as e:
+            pytest.skip(f"Docker image not found/pull failed (Environment Issue): {e}")
+    return LIVE_IMAGE
+
+
+class DockerRuntimePool:
+    """Pre-started DockerRuntimes lent out to live tests and reset when returned.
+
+    Session fixtures are per process, so under pytest-xdist every worker gets its own pool.
+    """
+
+    def __init__(self, runtimes: list[DockerRuntime], context: UserContext):
+        self.runtimes = runtimes
+        self._idle = deque(runtimes)
+        self._context = context
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[DockerRuntime]:
+        if not self._idle:
+            raise RuntimeError("Docker runtime pool exhausted")
+        runtime = self._idle.popleft()
+        try:
+            yield runtime
+        finally:
+            try:
+                await runtime.execute("rm -rf /home/user/* /tmp/*", "bash", self._context, "pool")
+            except Exception:
+                # A runtime that cannot be wiped is replaced rather than lent out dirty
+                await runtime.terminate()
+                await runtime.start()
+            finally:
+                self._idle.append(runtime)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def docker_runtime_pool(
+    docker_client: docker.DockerClient, live_image: str
+) -> AsyncGenerator[DockerRuntimePool, None]:
+    """Two started runtimes shared by the live tests; skips on Docker environment issues."""
+    runtimes = [DockerRuntime(image=live_image, timeout=30.0, client=docker_client) for _ in range(2)]
+    try:
+        # Let every start finish before raising, so the cleanup below sees each container that was created
+        results = await asyncio.gather(*(runtime.start() for runtime in runtimes), return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            raise errors[0]
+        yield DockerRuntimePool(runtimes, UserContext(user_id="live-pool", email="pool@example.com", scopes=[]))
+    except docker.errors.ImageNotFound as e:
+        pytest.skip(f"Docker image not found/pull failed (Environment Issue): {e}")
+    except docker.errors.APIError as e:
+        if "failed to mount" in str(e) and "overlay" in str(e):
+            pytest.skip(f"Docker Daemon reachable but failed to mount filesystem (Environment Issue): {e}")
+        else:
+            raise
+    except docker.errors.DockerException as e:
+        if "Connection aborted" in str(e) or "FileNotFoundError" in str(e):
+            pytest.skip(f"Docker connection lost/unreachable (Environment Issue): {e}")
+        else:
+            raise
+    finally:
+        await asyncio.gather(*(runtime.terminate() for runtime in runtimes if runtime.container))
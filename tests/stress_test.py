@@ -3,12 +3,10 @@ import time
 from typing import Any
 from unittest.mock import MagicMock, patch
 
-import pytest
 from coreason_sandbox.config import SandboxConfig
 from coreason_sandbox.mcp import SandboxMCP
 
 
-@pytest.mark.asyncio
 async def test_stress_concurrency(mock_user_context: Any) -> None:
     """
     Stress test to verify SessionManager and DockerRuntime stability under high load.
@@ -2,13 +2,11 @@ import asyncio
 from typing import Any
 from unittest.mock import MagicMock, patch
 
-import pytest
 from coreason_sandbox.config import SandboxConfig
 from coreason_sandbox.mcp import SandboxMCP
 from docker.errors import DockerException
 
 
-@pytest.mark.asyncio
 async def test_stress_mixed_workload(mock_user_context: Any) -> None:
     """
     Simulates a mixed workload with:
@@ -103,7 +101,6 @@ async def test_stress_mixed_workload(mock_user_context: Any) -> None:
         await mcp.shutdown()
 
 
-@pytest.mark.asyncio
 async def test_stress_reaper_collision(mock_user_context: Any) -> None:
     """
     Simulates concurrent access while the reaper is removing idle sessions.
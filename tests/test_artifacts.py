@@ -1,13 +1,14 @@
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
+import docker
 import pytest
 from coreason_sandbox.runtimes.docker import DockerRuntime
 
 
 @pytest.fixture
 def mock_docker_client() -> Any:
-    with patch("coreason_sandbox.runtimes.docker.docker.from_env") as mock:
+    with patch.object(docker, "from_env") as mock:
         yield mock
 
 
@@ -19,7 +20,6 @@ def docker_runtime(mock_docker_client: Any) -> DockerRuntime:
     return runtime
 
 
-@pytest.mark.asyncio
 async def test_execute_captures_artifacts(docker_runtime: DockerRuntime, mock_user_context: Any) -> None:
     # Mock exec_run for list_files (before)
     # Mock exec_run for execution
@@ -69,7 +69,6 @@ async def test_execute_captures_artifacts(docker_runtime: DockerRuntime, mock_us
     assert artifact.url is not None and "data:image/png;base64,ZGF0YQ==" in artifact.url
 
 
-@pytest.mark.asyncio
 async def test_artifact_manager_processing(tmp_path: Any, mock_user_context: Any) -> None:
     from coreason_sandbox.artifacts import ArtifactManager
 
@@ -92,13 +91,13 @@ async def test_artifact_manager_processing(tmp_path: Any, mock_user_context: Any
     assert ref.url is None  # No storage configured
 
 
-@pytest.mark.asyncio
 async def test_artifact_manager_storage(tmp_path: Any, mock_user_context: Any) -> None:
     from coreason_sandbox.artifacts import ArtifactManager
+    from coreason_sandbox.storage import S3Storage
 
-    mock_storage = MagicMock()
-    # Mock upload_file to return a coroutine result or use AsyncMock
-    mock_storage.upload_file = AsyncMock(return_value="http://s3/test.pdf")
+    # spec=S3Storage makes upload_file an AsyncMock with the real signature
+    mock_storage = MagicMock(spec=S3Storage)
+    mock_storage.upload_file.return_value = "http://s3/test.pdf"
 
     manager = ArtifactManager(storage=mock_storage)
 
@@ -109,3 +108,33 @@ async def test_artifact_manager_storage(tmp_path: Any, mock_user_context: Any) -
     assert ref.content_type == "application/pdf"
     assert ref.url == "http://s3/test.pdf"
     mock_storage.upload_file.assert_awaited_once()
+
+
+async def test_artifact_manager_unknown_mimetype(tmp_path: Any, mock_user_context: Any) -> None:
+    from coreason_sandbox.artifacts import ArtifactManager, _guess_content_type
+
+    _guess_content_type.cache_clear()
+    manager = ArtifactManager()
+
+    blob_path = tmp_path / "data.unknownext"
+    blob_path.write_bytes(b"blob")
+
+    ref = await manager.process_file(blob_path, "data.unknownext", mock_user_context, "sid")
+    assert ref.content_type == "application/octet-stream"
+
+    # Lookups are cached per suffix, case-insensitively, so a different name with the same suffix hits
+    ref = await manager.process_file(blob_path, "OTHER.UNKNOWNEXT", mock_user_context, "sid")
+    assert ref.content_type == "application/octet-stream"
+    assert _guess_content_type.cache_info().hits == 1
+
+
+async def test_artifact_manager_compound_extension(tmp_path: Any, mock_user_context: Any) -> None:
+    from coreason_sandbox.artifacts import ArtifactManager
+
+    manager = ArtifactManager()
+
+    archive_path = tmp_path / "report.tar.gz"
+    archive_path.write_bytes(b"archive")
+
+    ref = await manager.process_file(archive_path, "report.tar.gz", mock_user_context, "sid")
+    assert ref.content_type == "application/x-tar"
@@ -2,6 +2,7 @@ import time
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import docker
 import pytest
 from coreason_sandbox.models import ExecutionResult
 from coreason_sandbox.runtimes.docker import DockerRuntime
@@ -9,7 +10,7 @@ from coreason_sandbox.runtimes.docker import DockerRuntime
 
 @pytest.fixture
 def mock_docker_client() -> Any:
-    with patch("coreason_sandbox.runtimes.docker.docker.from_env") as mock:
+    with patch.object(docker, "from_env") as mock:
         yield mock
 
 
@@ -22,7 +23,6 @@ def docker_runtime(mock_docker_client: Any) -> Any:
     return runtime
 
 
-@pytest.mark.asyncio
 async def test_execute_python_success(docker_runtime: Any, mock_user_context: Any) -> None:
     # Setup mock return for exec_run sequence:
     # 1. ls (before)
@@ -35,7 +35,7 @@ async def test_execute_python_success(docker_runtime: Any, mock_user_context: An
     ]
 
     # Mock time.time() to ensure non-zero duration
-    with patch("coreason_sandbox.runtimes.docker.time.time", side_effect=[1000.0, 1001.5]):
+    with patch.object(time, "time", side_effect=[1000.0, 1001.5]):
         result = await docker_runtime.execute("print('hello')", "python", mock_user_context, "sid")
 
     assert isinstance(result, ExecutionResult)
@@ -52,7 +52,6 @@ async def test_execute_python_success(docker_runtime: Any, mock_user_context: An
     assert kwargs["demux"] is True
 
 
-@pytest.mark.asyncio
 async def test_execute_bash_success(docker_runtime: Any, mock_user_context: Any) -> None:
     docker_runtime.container.exec_run.side_effect = [(0, b""), (0, (b"root\n", b"")), (0, b"")]
 
@@ -63,7 +62,6 @@ async def test_execute_bash_success(docker_runtime: Any, mock_user_context: Any)
     assert args[0] == ["bash", "-c", "whoami"]
 
 
-@pytest.mark.asyncio
 async def test_execute_stderr(docker_runtime: Any, mock_user_context: Any) -> None:
     docker_runtime.container.exec_run.side_effect = [(0, b""), (1, (b"", b"error details")), (0, b"")]
 
@@ -74,7 +72,6 @@ async def test_execute_stderr(docker_runtime: Any, mock_user_context: Any) -> No
     assert result.stdout == ""
 
 
-@pytest.mark.asyncio
 async def test_execute_no_container(mock_docker_client: Any, mock_user_context: Any) -> None:
     # Runtime without start() called
     runtime = DockerRuntime()
@@ -82,7 +79,6 @@ async def test_execute_no_container(mock_docker_client: Any, mock_user_context:
         await runtime.execute("print(1)", "python", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
 async def test_execute_unsupported_language(docker_runtime: Any, mock_user_context: Any) -> None:
     # `execute` calls `_list_files_internal` first, so we need to mock that or let it run
     # Mocking ls to succeed
@@ -92,7 +88,6 @@ async def test_execute_unsupported_language(docker_runtime: Any, mock_user_conte
         await docker_runtime.execute("code", "java", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
 async def test_execute_r_language(docker_runtime: Any, mock_user_context: Any) -> None:
     docker_runtime.container.exec_run.side_effect = [(0, b""), (0, (b"[1] 4\n", b"")), (0, b"")]
 
@@ -103,7 +98,6 @@ async def test_execute_r_language(docker_runtime: Any, mock_user_context: Any) -
     assert args[0] == ["Rscript", "-e", "2+2"]
 
 
-@pytest.mark.asyncio
 async def test_execute_exception(docker_runtime: Any, mock_user_context: Any) -> None:
     from docker.errors import DockerException
 
@@ -114,7 +108,6 @@ async def test_execute_exception(docker_runtime: Any, mock_user_context: Any) ->
         await docker_runtime.execute("code", "python", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
 async def test_execute_artifact_handling_failure(docker_runtime: Any, mock_user_context: Any) -> None:
     # Simulate success execution but failure in artifact retrieval
     docker_runtime.container.exec_run.side_effect = [
@@ -133,7 +126,6 @@ async def test_execute_artifact_handling_failure(docker_runtime: Any, mock_user_
         assert len(result.artifacts) == 0
 
 
-@pytest.mark.asyncio
 async def test_execute_timeout(docker_runtime: Any, mock_user_context: Any) -> None:
     # Set a very short timeout
     docker_runtime.timeout = 0.1
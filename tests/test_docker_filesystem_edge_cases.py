@@ -1,13 +1,14 @@
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import docker
 import pytest
 from coreason_sandbox.runtimes.docker import DockerRuntime
 
 
 @pytest.fixture
 def mock_docker_client() -> Any:
-    with patch("coreason_sandbox.runtimes.docker.docker.from_env") as mock:
+    with patch.object(docker, "from_env") as mock:
         yield mock
 
 
@@ -20,7 +21,6 @@ def docker_runtime(mock_docker_client: Any) -> DockerRuntime:
     return runtime
 
 
-@pytest.mark.asyncio
 async def test_path_resolution_relative_subdir(docker_runtime: DockerRuntime, mock_user_context: Any) -> None:
     """Verify that a relative path 'subdir' resolves to '/home/user/subdir'."""
     assert docker_runtime.container is not None
@@ -33,7 +33,6 @@ async def test_path_resolution_relative_subdir(docker_runtime: DockerRuntime, mo
     docker_runtime.container.exec_run.assert_called_with("ls -1 /home/user/subdir")
 
 
-@pytest.mark.asyncio
 async def test_path_resolution_absolute(docker_runtime: DockerRuntime, mock_user_context: Any) -> None:
     """Verify that an absolute path is used as-is."""
     assert docker_runtime.container is not None
@@ -45,7 +44,6 @@ async def test_path_resolution_absolute(docker_runtime: DockerRuntime, mock_user
     docker_runtime.container.exec_run.assert_called_with("ls -1 /tmp/custom")
 
 
-@pytest.mark.asyncio
 async def test_path_resolution_dot(docker_runtime: DockerRuntime, mock_user_context: Any) -> None:
     """Verify that '.' resolves to '/home/user/.'."""
     assert docker_runtime.container is not None
@@ -56,7 +54,6 @@ async def test_path_resolution_dot(docker_runtime: DockerRuntime, mock_user_cont
     docker_runtime.container.exec_run.assert_called_with("ls -1 /home/user/.")
 
 
-@pytest.mark.asyncio
 async def test_start_creates_home_directory(mock_docker_client: Any) -> None:
     """Verify that start() explicitly ensures /home/user exists."""
     runtime = DockerRuntime()
@@ -71,7 +68,6 @@ async def test_start_creates_home_directory(mock_docker_client: Any) -> None:
     mock_container.exec_run.assert_called_with("mkdir -p /home/user")
 
 
-@pytest.mark.asyncio
 async def test_upload_tar_structure(docker_runtime: DockerRuntime, tmp_path: Any, mock_user_context: Any) -> None:
     """Verify that upload packs the file correctly relative to /home/user if needed."""
     # Note: upload uses os.path.dirname(remote_path) or "/" for put_archive path
@@ -2,13 +2,14 @@ import subprocess
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import docker
 import pytest
 from coreason_sandbox.runtimes.docker import DockerRuntime
 
 
 @pytest.fixture
 def mock_docker_client() -> Any:
-    with patch("coreason_sandbox.runtimes.docker.docker.from_env") as mock:
+    with patch.object(docker, "from_env") as mock:
         yield mock
 
 
@@ -21,68 +22,66 @@ def docker_runtime(mock_docker_client: Any) -> Any:
     return runtime
 
 
-@pytest.mark.asyncio
-async def test_install_package_success(docker_runtime: Any, mock_user_context: Any) -> None:
+async def test_install_package_success(
+    docker_runtime: Any, mock_user_context: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
     # 1. Download/tar (mocked)
-    with patch("coreason_sandbox.runtimes.docker.DockerRuntime._download_and_package", return_value=b"tar_data"):
-        # 2. Upload/install (mocked container)
-        docker_runtime.container.exec_run.return_value = (0, b"Success")
+    monkeypatch.setattr(DockerRuntime, "_download_and_package", MagicMock(return_value=b"tar_data"))
+    # 2. Upload/install (mocked container)
+    docker_runtime.container.exec_run.return_value = (0, b"Success")
 
-        await docker_runtime.install_package("pandas", mock_user_context, "sid")
+    await docker_runtime.install_package("pandas", mock_user_context, "sid")
 
-        # Verify upload
-        docker_runtime.container.put_archive.assert_called_once()
-        args, kwargs = docker_runtime.container.put_archive.call_args
+    # Verify upload
+    docker_runtime.container.put_archive.assert_called_once()
+    args, kwargs = docker_runtime.container.put_archive.call_args
 
-        path_arg = kwargs.get("path")
-        if not path_arg and args:
-            path_arg = args[0]
+    path_arg = kwargs.get("path")
+    if not path_arg and args:
+        path_arg = args[0]
 
-        assert path_arg == "/tmp/packages/pandas"
-        assert kwargs["data"] == b"tar_data"
+    assert path_arg == "/tmp/packages/pandas"
+    assert kwargs["data"] == b"tar_data"
 
-        # Verify install cmd
-        docker_runtime.container.exec_run.assert_called()
-        cmd = docker_runtime.container.exec_run.call_args[0][0]
-        assert "pip install" in " ".join(cmd)
-        assert "pandas" in cmd
+    # Verify install cmd
+    docker_runtime.container.exec_run.assert_called()
+    cmd = docker_runtime.container.exec_run.call_args[0][0]
+    assert "pip install" in " ".join(cmd)
+    assert "pandas" in cmd
 
 
-@pytest.mark.asyncio
 async def test_install_package_not_allowed(docker_runtime: Any, mock_user_context: Any) -> None:
     # requests is not in allowed_packages={"pandas"}
     with pytest.raises(ValueError, match="is not in the allowed list"):
         await docker_runtime.install_package("requests", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
 async def test_install_package_invalid_name(docker_runtime: Any, mock_user_context: Any) -> None:
     """Test that invalid package names raise ValueError."""
     with pytest.raises(ValueError, match="Invalid package requirement"):
         await docker_runtime.install_package("!invalid-package-name", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
-async def test_install_package_install_failed(docker_runtime: Any, mock_user_context: Any) -> None:
-    with patch("coreason_sandbox.runtimes.docker.DockerRuntime._download_and_package", return_value=b"tar_data"):
-        docker_runtime.container.exec_run.return_value = (1, b"Install error")
+async def test_install_package_install_failed(
+    docker_runtime: Any, mock_user_context: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(DockerRuntime, "_download_and_package", MagicMock(return_value=b"tar_data"))
+    docker_runtime.container.exec_run.return_value = (1, b"Install error")
 
-        with pytest.raises(RuntimeError, match="Failed to install package"):
-            await docker_runtime.install_package("pandas", mock_user_context, "sid")
+    with pytest.raises(RuntimeError, match="Failed to install package"):
+        await docker_runtime.install_package("pandas", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
-async def test_install_package_download_failed(docker_runtime: Any, mock_user_context: Any) -> None:
+async def test_install_package_download_failed(
+    docker_runtime: Any, mock_user_context: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test re-raising RuntimeError from _download_and_package."""
-    with patch(
-        "coreason_sandbox.runtimes.docker.DockerRuntime._download_and_package",
-        side_effect=RuntimeError("Download fail"),
-    ):
-        with pytest.raises(RuntimeError, match="Download fail"):
-            await docker_runtime.install_package("pandas", mock_user_context, "sid")
+    monkeypatch.setattr(DockerRuntime, "_download_and_package", MagicMock(side_effect=RuntimeError("Download fail")))
+
+    with pytest.raises(RuntimeError, match="Download fail"):
+        await docker_runtime.install_package("pandas", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
 async def test_install_package_no_container(mock_docker_client: Any, mock_user_context: Any) -> None:
     """Test installing package without a started container."""
     # Ensure mock_docker_client is used to avoid real docker connection
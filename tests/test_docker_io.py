@@ -3,6 +3,7 @@ import tarfile
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import docker
 import pytest
 from coreason_sandbox.runtimes.docker import DockerRuntime
 from docker.errors import DockerException, NotFound
@@ -10,7 +11,7 @@ from docker.errors import DockerException, NotFound
 
 @pytest.fixture
 def mock_docker_client() -> Any:
-    with patch("coreason_sandbox.runtimes.docker.docker.from_env") as mock:
+    with patch.object(docker, "from_env") as mock:
         yield mock
 
 
@@ -22,7 +23,6 @@ def docker_runtime(mock_docker_client: Any) -> DockerRuntime:
     return runtime
 
 
-@pytest.mark.asyncio
 async def test_upload_success(docker_runtime: DockerRuntime, tmp_path: Any, mock_user_context: Any) -> None:
     # Create a dummy local file
     local_file = tmp_path / "test.txt"
@@ -47,14 +47,12 @@ async def test_upload_success(docker_runtime: DockerRuntime, tmp_path: Any, mock
         assert "test.txt" in names
 
 
-@pytest.mark.asyncio
 async def test_upload_no_file(docker_runtime: DockerRuntime, tmp_path: Any, mock_user_context: Any) -> None:
     local_file = tmp_path / "non_existent.txt"
     with pytest.raises(FileNotFoundError):
         await docker_runtime.upload(local_file, "/remote/path", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
 async def test_upload_no_container(mock_docker_client: Any, tmp_path: Any, mock_user_context: Any) -> None:
     runtime = DockerRuntime()
     local_file = tmp_path / "test.txt"
@@ -64,7 +62,6 @@ async def test_upload_no_container(mock_docker_client: Any, tmp_path: Any, mock_
         await runtime.upload(local_file, "/remote", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
 async def test_download_success(docker_runtime: DockerRuntime, tmp_path: Any, mock_user_context: Any) -> None:
     # Mock get_archive return value
     # Generator of bytes representing a tar file
@@ -87,7 +84,6 @@ async def test_download_success(docker_runtime: DockerRuntime, tmp_path: Any, mo
     assert dest_path.read_bytes() == file_content
 
 
-@pytest.mark.asyncio
 async def test_download_not_found(docker_runtime: DockerRuntime, tmp_path: Any, mock_user_context: Any) -> None:
     # Simulate Docker NotFound exception
     assert docker_runtime.container is not None
@@ -100,7 +96,6 @@ async def test_download_not_found(docker_runtime: DockerRuntime, tmp_path: Any,
         await docker_runtime.download("/remote/missing.txt", dest_path, mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
 async def test_download_no_container(mock_docker_client: Any, tmp_path: Any, mock_user_context: Any) -> None:
     runtime = DockerRuntime()
     dest_path = tmp_path / "dest.txt"
@@ -1,6 +1,7 @@
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import docker
 import pytest
 from coreason_sandbox.runtimes.docker import DockerRuntime
 from docker.errors import DockerException, NotFound
@@ -8,7 +9,7 @@ from docker.errors import DockerException, NotFound
 
 @pytest.fixture
 def mock_docker_client() -> Any:
-    with patch("coreason_sandbox.runtimes.docker.docker.from_env") as mock:
+    with patch.object(docker, "from_env") as mock:
         yield mock
 
 
@@ -20,7 +21,6 @@ def docker_runtime(mock_docker_client: Any) -> DockerRuntime:
     return runtime
 
 
-@pytest.mark.asyncio
 async def test_upload_exception(docker_runtime: DockerRuntime, tmp_path: Any, mock_user_context: Any) -> None:
     local_file = tmp_path / "test.txt"
     local_file.write_text("content")
@@ -34,7 +34,6 @@ async def test_upload_exception(docker_runtime: DockerRuntime, tmp_path: Any, mo
         await docker_runtime.upload(local_file, "remote.txt", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
 async def test_download_docker_exception(docker_runtime: DockerRuntime, tmp_path: Any, mock_user_context: Any) -> None:
     assert docker_runtime.container is not None
     docker_runtime.container.get_archive.side_effect = DockerException("Download failed")
@@ -44,7 +43,6 @@ async def test_download_docker_exception(docker_runtime: DockerRuntime, tmp_path
         await docker_runtime.download("remote.txt", dest, mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
 async def test_download_file_not_found_exception(
     docker_runtime: DockerRuntime, tmp_path: Any, mock_user_context: Any
 ) -> None:
@@ -57,7 +55,6 @@ async def test_download_file_not_found_exception(
         await docker_runtime.download("remote.txt", dest, mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
 async def test_download_tar_extraction_exception(
     docker_runtime: DockerRuntime, tmp_path: Any, mock_user_context: Any
 ) -> None:
@@ -83,7 +80,6 @@ async def test_download_tar_extraction_exception(
         await docker_runtime.download("remote.txt", dest, mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
 async def test_download_tar_extract_file_none(
     docker_runtime: DockerRuntime, tmp_path: Any, mock_user_context: Any
 ) -> None:
@@ -1,6 +1,7 @@
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import docker
 import pytest
 from coreason_sandbox.runtimes.docker import DockerRuntime
 from docker.errors import DockerException
@@ -8,7 +9,7 @@ from docker.errors import DockerException
 
 @pytest.fixture
 def mock_docker_client() -> Any:
-    with patch("coreason_sandbox.runtimes.docker.docker.from_env") as mock:
+    with patch.object(docker, "from_env") as mock:
         yield mock
 
 
@@ -17,7 +18,6 @@ def docker_runtime(mock_docker_client: Any) -> DockerRuntime:
     return DockerRuntime()
 
 
-@pytest.mark.asyncio
 async def test_start_success(docker_runtime: DockerRuntime, mock_docker_client: Any) -> None:
     mock_container = MagicMock()
     mock_container.short_id = "test_id"
@@ -36,7 +36,13 @@ async def test_start_success(docker_runtime: DockerRuntime, mock_docker_client:
     assert call_args[1]["working_dir"] == "/home/user"
 
 
-@pytest.mark.asyncio
+def test_init_reuses_injected_client(mock_docker_client: Any) -> None:
+    client = MagicMock()
+    runtime = DockerRuntime(client=client)
+    assert runtime.client is client
+    mock_docker_client.assert_not_called()
+
+
 async def test_start_failure(docker_runtime: DockerRuntime, mock_docker_client: Any) -> None:
     mock_docker_client.return_value.containers.run.side_effect = DockerException("Start failed")
 
@@ -46,7 +52,6 @@ async def test_start_failure(docker_runtime: DockerRuntime, mock_docker_client:
     assert docker_runtime.container is None
 
 
-@pytest.mark.asyncio
 async def test_terminate_success(docker_runtime: DockerRuntime, mock_docker_client: Any) -> None:
     mock_container = MagicMock()
     mock_container.short_id = "test_id"
@@ -58,14 +63,12 @@ async def test_terminate_success(docker_runtime: DockerRuntime, mock_docker_clie
     assert docker_runtime.container is None
 
 
-@pytest.mark.asyncio
 async def test_terminate_no_container(docker_runtime: DockerRuntime) -> None:
     # Should not raise exception
     await docker_runtime.terminate()
     assert docker_runtime.container is None
 
 
-@pytest.mark.asyncio
 async def test_terminate_failure(docker_runtime: DockerRuntime) -> None:
     mock_container = MagicMock()
     mock_container.kill.side_effect = DockerException("Kill failed")
@@ -78,7 +81,6 @@ async def test_terminate_failure(docker_runtime: DockerRuntime) -> None:
     assert docker_runtime.container is None
 
 
-@pytest.mark.asyncio
 async def test_list_files_success(docker_runtime: DockerRuntime, mock_user_context: Any) -> None:
     docker_runtime.container = MagicMock()
     docker_runtime.container.exec_run.return_value = (0, b"file1\nfile2\n")
@@ -88,7 +90,6 @@ async def test_list_files_success(docker_runtime: DockerRuntime, mock_user_conte
     assert files == ["file1", "file2"]
 
 
-@pytest.mark.asyncio
 async def test_list_files_failure(docker_runtime: DockerRuntime, mock_user_context: Any) -> None:
     docker_runtime.container = MagicMock()
     docker_runtime.container.exec_run.return_value = (1, b"Error")
@@ -97,13 +98,11 @@ async def test_list_files_failure(docker_runtime: DockerRuntime, mock_user_conte
     assert files == []
 
 
-@pytest.mark.asyncio
 async def test_list_files_no_container(docker_runtime: DockerRuntime, mock_user_context: Any) -> None:
     with pytest.raises(RuntimeError, match="Sandbox not started"):
         await docker_runtime.list_files(".", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
 async def test_list_files_internal_exception(docker_runtime: DockerRuntime, mock_user_context: Any) -> None:
     # _list_files_internal suppresses exceptions
     with patch.object(docker_runtime, "list_files", side_effect=Exception("Fail")):
@@ -1,16 +1,65 @@
 import asyncio
+import re
 import time
+from collections.abc import Awaitable, Callable, Sequence
+from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
+from coreason_sandbox.runtimes import e2b as _e2b_mod
 from coreason_sandbox.runtimes.e2b import E2BRuntime
+from e2b.sandbox_sync.commands.command import Commands
+from e2b.sandbox_sync.filesystem.filesystem import Filesystem
+from e2b_code_interpreter import Sandbox as E2BSandbox
+
+_FAIL = re.compile("Fail")
+_START_FAILED = re.compile("Start failed")
+_NOT_STARTED = re.compile("Sandbox not started")
+_TIMED_OUT = re.compile(r"Execution exceeded 0\.1 seconds limit")
+
+
+def _exec(
+    stdout: Sequence[str] = (), stderr: Sequence[str] = (), error: Any = None, results: Sequence[Any] = ()
+) -> SimpleNamespace:
+    """Build a fake E2B execution result."""
+    return SimpleNamespace(
+        logs=SimpleNamespace(
+            stdout=[SimpleNamespace(content=line) for line in stdout],
+            stderr=[SimpleNamespace(content=line) for line in stderr],
+        ),
+        error=error,
+        results=list(results),
+    )
+
+
+def _entry(name: str) -> SimpleNamespace:
+    """Build a fake E2B filesystem entry."""
+    return SimpleNamespace(name=name)
+
+
+def _make_sandbox(sandbox_id: str = "e2b_id") -> MagicMock:
+    """Build a sandbox mock restricted to the real SDK surface."""
+    sandbox = MagicMock(spec=E2BSandbox)
+    sandbox.files = MagicMock(spec=Filesystem)
+    sandbox.commands = MagicMock(spec=Commands)
+    sandbox.sandbox_id = sandbox_id
+    return sandbox
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _patched_e2b_sandbox() -> Any:
+    # Patch the SDK class once for the whole module instead of once per test.
+    with patch.object(_e2b_mod, "E2BSandbox") as mock:
+        yield mock
 
 
 @pytest.fixture
-def mock_e2b_sandbox() -> Any:
-    with patch("coreason_sandbox.runtimes.e2b.E2BSandbox") as mock:
-        yield mock
+def mock_e2b_sandbox(_patched_e2b_sandbox: Any) -> Any:
+    _patched_e2b_sandbox.reset_mock(side_effect=True)
+    _patched_e2b_sandbox.return_value = _make_sandbox()
+    return _patched_e2b_sandbox
 
 
 @pytest.fixture
@@ -18,34 +67,25 @@ def e2b_runtime(mock_e2b_sandbox: Any) -> E2BRuntime:
     runtime = E2BRuntime(api_key="test_key")
     # Manually set sandbox as if started
     runtime.sandbox = mock_e2b_sandbox.return_value
-    runtime.sandbox.sandbox_id = "e2b_id"
     return runtime
 
 
-@pytest.mark.asyncio
 async def test_start_success(mock_e2b_sandbox: Any) -> None:
     runtime = E2BRuntime(api_key="key")
     await runtime.start()
-    mock_e2b_sandbox.assert_called_once()
-    assert runtime.sandbox is not None
+    assert runtime.sandbox is mock_e2b_sandbox.return_value
 
 
-@pytest.mark.asyncio
 async def test_start_failure(mock_e2b_sandbox: Any) -> None:
     mock_e2b_sandbox.side_effect = Exception("Start failed")
     runtime = E2BRuntime(api_key="key")
-    with pytest.raises(Exception, match="Start failed"):
+    with pytest.raises(Exception, match=_START_FAILED):
         await runtime.start()
 
 
-@pytest.mark.asyncio
 async def test_execute_python_success(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
     # Mock execution result
-    mock_exec = MagicMock()
-    mock_exec.logs.stdout = [MagicMock(content="hello")]
-    mock_exec.logs.stderr = []
-    mock_exec.error = None
-    mock_exec.results = []
+    mock_exec = _exec(stdout=["hello"])
 
     assert e2b_runtime.sandbox is not None
     e2b_runtime.sandbox.run_code.return_value = mock_exec
@@ -57,13 +97,8 @@ async def test_execute_python_success(e2b_runtime: E2BRuntime, mock_user_context
     assert result.exit_code == 0
 
 
-@pytest.mark.asyncio
 async def test_execute_python_error(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
-    mock_exec = MagicMock()
-    mock_exec.logs.stdout = []
-    mock_exec.logs.stderr = []
-    mock_exec.error = MagicMock(name="NameError", value="msg", traceback="tb")
-    mock_exec.results = []
+    mock_exec = _exec(error=MagicMock(name="NameError", value="msg", traceback="tb"))
 
     assert e2b_runtime.sandbox is not None
     e2b_runtime.sandbox.run_code.return_value = mock_exec
@@ -73,24 +108,11 @@ async def test_execute_python_error(e2b_runtime: E2BRuntime, mock_user_context:
     assert "NameError" in result.stderr
 
 
-@pytest.mark.asyncio
 async def test_execute_python_artifacts(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
-    mock_exec = MagicMock()
-    mock_exec.logs.stdout = []
-    mock_exec.logs.stderr = []
-    mock_exec.error = None
-
-    # Mock png result
-    result_obj = MagicMock()
-    result_obj.png = "base64data"
-    result_obj.text = None
-    mock_exec.results = [result_obj]
-
-    # Mock text result
-    text_obj = MagicMock()
-    text_obj.png = None
-    text_obj.text = "output"
-    mock_exec.results.append(text_obj)
+    # Mock png result followed by a text result
+    result_obj = SimpleNamespace(png="base64data", text=None)
+    text_obj = SimpleNamespace(png=None, text="output")
+    mock_exec = _exec(results=[result_obj, text_obj])
 
     assert e2b_runtime.sandbox is not None
     e2b_runtime.sandbox.run_code.return_value = mock_exec
@@ -103,42 +125,44 @@ async def test_execute_python_artifacts(e2b_runtime: E2BRuntime, mock_user_conte
     assert "output" in result.stdout
 
 
-@pytest.mark.asyncio
-async def test_execute_python_filesystem_artifacts(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
-    """Test detection of filesystem artifacts (e.g. CSV files)."""
-    mock_exec = MagicMock()
-    mock_exec.logs.stdout = []
-    mock_exec.logs.stderr = []
-    mock_exec.error = None
-    mock_exec.results = []
-
+@pytest.mark.parametrize(
+    "before, after, read, expected",
+    [
+        (["existing.txt"], ["existing.txt", "new.csv"], {"new.csv": b"csv_content"}, {"new.csv": "text/csv"}),
+        (
+            [],
+            ["data.csv", "my chart.png", "notes.txt"],
+            {"data.csv": b"csv", "my chart.png": b"png", "notes.txt": b"notes"},
+            {"data.csv": "text/csv", "my chart.png": "image/png", "notes.txt": "text/plain"},
+        ),
+        (["config.json", "data.csv"], ["data.csv"], {"data.csv": b"content"}, {}),
+        ([], ["new.csv"], Exception("Download Fail"), {}),
+    ],
+    ids=["new_file", "multiple_with_spaces", "deletion_and_modification", "retrieval_exception"],
+)
+async def test_execute_python_filesystem_artifacts(
+    e2b_runtime: E2BRuntime,
+    mock_user_context: Any,
+    before: list[str],
+    after: list[str],
+    read: dict[str, bytes] | Exception,
+    expected: dict[str, str],
+) -> None:
+    """Only files created by the execution are downloaded and returned as artifacts."""
     assert e2b_runtime.sandbox is not None
-    e2b_runtime.sandbox.run_code.return_value = mock_exec
-
-    # Mock list_files to return empty list first, then list with new file
-    entry1 = MagicMock()
-    entry1.name = "existing.txt"
-    entry2 = MagicMock()
-    entry2.name = "new.csv"
-
+    e2b_runtime.sandbox.run_code.return_value = _exec()
     e2b_runtime.sandbox.files.list.side_effect = [
-        [entry1],  # Before
-        [entry1, entry2],  # After
+        [_entry(name) for name in before],
+        [_entry(name) for name in after],
     ]
+    e2b_runtime.sandbox.files.read.side_effect = read if isinstance(read, Exception) else read.get
 
-    # Mock download
-    e2b_runtime.sandbox.files.read.return_value = b"csv_content"
-
-    result = await e2b_runtime.execute("create_csv()", "python", mock_user_context, "sid")
+    result = await e2b_runtime.execute("create()", "python", mock_user_context, "sid")
 
-    assert len(result.artifacts) == 1
-    assert result.artifacts[0].filename == "new.csv"
-    assert result.artifacts[0].content_type == "text/csv"  # inferred from extension
-    # Verify download called
-    e2b_runtime.sandbox.files.read.assert_called_with("new.csv")
+    assert result.exit_code == 0
+    assert {a.filename: a.content_type for a in result.artifacts} == expected
 
 
-@pytest.mark.asyncio
 async def test_execute_bash_success(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
     mock_cmd = MagicMock()
     mock_cmd.stdout = "root"
@@ -153,7 +177,6 @@ async def test_execute_bash_success(e2b_runtime: E2BRuntime, mock_user_context:
     assert result.stdout == "root"
 
 
-@pytest.mark.asyncio
 async def test_execute_r_success(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
     mock_cmd = MagicMock()
     mock_cmd.stdout = "[1] 4"
@@ -168,28 +191,34 @@ async def test_execute_r_success(e2b_runtime: E2BRuntime, mock_user_context: Any
     assert result.stdout == "[1] 4"
 
 
-@pytest.mark.asyncio
 async def test_execute_unsupported(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
     with pytest.raises(ValueError):
         await e2b_runtime.execute("code", "java", mock_user_context, "sid")  # type: ignore
 
 
-@pytest.mark.asyncio
 async def test_execute_exception(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
     assert e2b_runtime.sandbox is not None
     e2b_runtime.sandbox.run_code.side_effect = Exception("Fail")
-    with pytest.raises(Exception, match="Fail"):
+    with pytest.raises(Exception, match=_FAIL):
         await e2b_runtime.execute("code", "python", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
-async def test_execute_no_sandbox(mock_e2b_sandbox: Any, mock_user_context: Any) -> None:
-    runtime = E2BRuntime()
-    with pytest.raises(RuntimeError):
-        await runtime.execute("code", "python", mock_user_context, "sid")
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda r, ctx: r.execute("code", "python", ctx, "sid"),
+        lambda r, ctx: r.upload(Path("test.txt"), "remote.txt", ctx, "sid"),
+        lambda r, ctx: r.download("remote.txt", Path("dest.txt"), ctx, "sid"),
+        lambda r, ctx: r.install_package("req", ctx, "sid"),
+        lambda r, ctx: r.list_files(".", ctx, "sid"),
+    ],
+    ids=["execute", "upload", "download", "install_package", "list_files"],
+)
+async def test_no_sandbox(call: Callable[[E2BRuntime, Any], Awaitable[Any]], mock_user_context: Any) -> None:
+    with pytest.raises(RuntimeError, match=_NOT_STARTED):
+        await call(E2BRuntime(), mock_user_context)
 
 
-@pytest.mark.asyncio
 async def test_upload_success(e2b_runtime: E2BRuntime, tmp_path: Any, mock_user_context: Any) -> None:
     local_file = tmp_path / "test.txt"
     local_file.write_text("content")
@@ -200,33 +229,22 @@ async def test_upload_success(e2b_runtime: E2BRuntime, tmp_path: Any, mock_user_
     e2b_runtime.sandbox.files.write.assert_called()
 
 
-@pytest.mark.asyncio
 async def test_upload_no_file(e2b_runtime: E2BRuntime, tmp_path: Any, mock_user_context: Any) -> None:
     local_file = tmp_path / "missing.txt"
     with pytest.raises(FileNotFoundError):
         await e2b_runtime.upload(local_file, "remote.txt", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
 async def test_upload_exception(e2b_runtime: E2BRuntime, tmp_path: Any, mock_user_context: Any) -> None:
     local_file = tmp_path / "test.txt"
     local_file.write_text("content")
     assert e2b_runtime.sandbox is not None
     e2b_runtime.sandbox.files.write.side_effect = Exception("Fail")
 
-    with pytest.raises(Exception, match="Fail"):
+    with pytest.raises(Exception, match=_FAIL):
         await e2b_runtime.upload(local_file, "remote.txt", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
-async def test_upload_no_sandbox(tmp_path: Any, mock_user_context: Any) -> None:
-    runtime = E2BRuntime()
-    local_file = tmp_path / "test.txt"
-    with pytest.raises(RuntimeError):
-        await runtime.upload(local_file, "remote.txt", mock_user_context, "sid")
-
-
-@pytest.mark.asyncio
 async def test_download_success(e2b_runtime: E2BRuntime, tmp_path: Any, mock_user_context: Any) -> None:
     assert e2b_runtime.sandbox is not None
     e2b_runtime.sandbox.files.read.return_value = b"content"
@@ -237,7 +255,6 @@ async def test_download_success(e2b_runtime: E2BRuntime, tmp_path: Any, mock_use
     assert dest.read_text() == "content"
 
 
-@pytest.mark.asyncio
 async def test_download_not_found(e2b_runtime: E2BRuntime, tmp_path: Any, mock_user_context: Any) -> None:
     assert e2b_runtime.sandbox is not None
     e2b_runtime.sandbox.files.read.return_value = None
@@ -247,39 +264,28 @@ async def test_download_not_found(e2b_runtime: E2BRuntime, tmp_path: Any, mock_u
         await e2b_runtime.download("missing.txt", dest, mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
 async def test_download_exception(e2b_runtime: E2BRuntime, tmp_path: Any, mock_user_context: Any) -> None:
     assert e2b_runtime.sandbox is not None
     e2b_runtime.sandbox.files.read.side_effect = Exception("Fail")
     dest = tmp_path / "downloaded.txt"
-    with pytest.raises(Exception, match="Fail"):
+    with pytest.raises(Exception, match=_FAIL):
         await e2b_runtime.download("remote.txt", dest, mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
-async def test_download_no_sandbox(tmp_path: Any, mock_user_context: Any) -> None:
-    runtime = E2BRuntime()
-    dest = tmp_path / "dest.txt"
-    with pytest.raises(RuntimeError):
-        await runtime.download("remote.txt", dest, mock_user_context, "sid")
-
-
-@pytest.mark.asyncio
 async def test_terminate_success(e2b_runtime: E2BRuntime) -> None:
     # Capture the sandbox mock before terminate clears it
     sandbox_mock = e2b_runtime.sandbox
     assert sandbox_mock is not None
 
     await e2b_runtime.terminate()
-    sandbox_mock.close.assert_called_once()
+    sandbox_mock.kill.assert_called_once()
     assert e2b_runtime.sandbox is None
 
 
-@pytest.mark.asyncio
 async def test_terminate_exception(e2b_runtime: E2BRuntime) -> None:
     sandbox_mock = e2b_runtime.sandbox
     assert sandbox_mock is not None
-    sandbox_mock.close.side_effect = Exception("Fail")
+    sandbox_mock.kill.side_effect = Exception("Fail")
 
     # Should not raise exception
     await e2b_runtime.terminate()
@@ -287,46 +293,32 @@ async def test_terminate_exception(e2b_runtime: E2BRuntime) -> None:
     assert e2b_runtime.sandbox is None
 
 
-@pytest.mark.asyncio
 async def test_terminate_no_sandbox() -> None:
     runtime = E2BRuntime()
     await runtime.terminate()
 
 
-@pytest.mark.asyncio
 async def test_install_package_success(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
     assert e2b_runtime.sandbox is not None
     await e2b_runtime.install_package("requests", mock_user_context, "sid")
     e2b_runtime.sandbox.commands.run.assert_called_with("pip install requests")
 
 
-@pytest.mark.asyncio
 async def test_install_package_exception(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
     assert e2b_runtime.sandbox is not None
     e2b_runtime.sandbox.commands.run.side_effect = Exception("Fail")
-    with pytest.raises(Exception, match="Fail"):
+    with pytest.raises(Exception, match=_FAIL):
         await e2b_runtime.install_package("requests", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
-async def test_install_package_no_sandbox(mock_user_context: Any) -> None:
-    runtime = E2BRuntime()
-    with pytest.raises(RuntimeError):
-        await runtime.install_package("req", mock_user_context, "sid")
-
-
-@pytest.mark.asyncio
 async def test_list_files_success(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
     assert e2b_runtime.sandbox is not None
-    entry = MagicMock()
-    entry.name = "file.txt"
-    e2b_runtime.sandbox.files.list.return_value = [entry]
+    e2b_runtime.sandbox.files.list.return_value = [_entry("file.txt")]
 
     files = await e2b_runtime.list_files(".", mock_user_context, "sid")
     assert files == ["file.txt"]
 
 
-@pytest.mark.asyncio
 async def test_list_files_exception(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
     assert e2b_runtime.sandbox is not None
     e2b_runtime.sandbox.files.list.side_effect = Exception("Fail")
@@ -335,7 +327,6 @@ async def test_list_files_exception(e2b_runtime: E2BRuntime, mock_user_context:
     assert files == []
 
 
-@pytest.mark.asyncio
 async def test_list_files_internal_exception(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
     assert e2b_runtime.sandbox is not None
     e2b_runtime.sandbox.files.list.side_effect = Exception("Fail")
@@ -344,207 +335,84 @@ async def test_list_files_internal_exception(e2b_runtime: E2BRuntime, mock_user_
     assert files == set()
 
 
-@pytest.mark.asyncio
 async def test_list_files_internal_no_sandbox(mock_user_context: Any) -> None:
     runtime = E2BRuntime()
     files = await runtime._list_files_internal(".", mock_user_context, "sid")
     assert files == set()
 
 
-@pytest.mark.asyncio
-async def test_execute_python_artifact_retrieval_exception(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
-    mock_exec = MagicMock()
-    mock_exec.logs.stdout = []
-    mock_exec.logs.stderr = []
-    mock_exec.error = None
-    mock_exec.results = []
-
-    assert e2b_runtime.sandbox is not None
-    e2b_runtime.sandbox.run_code.return_value = mock_exec
-
-    entry1 = MagicMock()
-    entry1.name = "new.csv"
-    e2b_runtime.sandbox.files.list.side_effect = [
-        [],  # Before
-        [entry1],  # After
-    ]
-
-    e2b_runtime.sandbox.files.read.side_effect = Exception("Download Fail")
-
-    result = await e2b_runtime.execute("create()", "python", mock_user_context, "sid")
-
-    assert len(result.artifacts) == 0
-    assert result.exit_code == 0
-
-
-@pytest.mark.asyncio
-async def test_list_files_no_sandbox(mock_user_context: Any) -> None:
-    runtime = E2BRuntime()
-    with pytest.raises(RuntimeError):
-        await runtime.list_files(".", mock_user_context, "sid")
-
-
-@pytest.mark.asyncio
-async def test_execute_python_multiple_artifacts_with_spaces(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
-    mock_exec = MagicMock()
-    mock_exec.logs.stdout = []
-    mock_exec.logs.stderr = []
-    mock_exec.error = None
-    mock_exec.results = []
-
-    assert e2b_runtime.sandbox is not None
-    e2b_runtime.sandbox.run_code.return_value = mock_exec
-
-    entry1 = MagicMock()
-    entry1.name = "data.csv"
-    entry2 = MagicMock()
-    entry2.name = "my chart.png"
-    entry3 = MagicMock()
-    entry3.name = "notes.txt"
-
-    e2b_runtime.sandbox.files.list.side_effect = [
-        [],  # Before
-        [entry1, entry2, entry3],  # After
-    ]
-
-    def side_effect_read(path: str) -> bytes | None:
-        if path == "data.csv":
-            return b"csv"
-        if path == "my chart.png":
-            return b"png"
-        if path == "notes.txt":
-            return b"notes"
-        return None
-
-    e2b_runtime.sandbox.files.read.side_effect = side_effect_read
-
-    result = await e2b_runtime.execute("create_multiple()", "python", mock_user_context, "sid")
-
-    assert len(result.artifacts) == 3
-    filenames = {a.filename for a in result.artifacts}
-    assert filenames == {"data.csv", "my chart.png", "notes.txt"}
-
-
-@pytest.mark.asyncio
-async def test_execute_file_deletion_and_modification(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
-    mock_exec = MagicMock()
-    mock_exec.logs.stdout = []
-    mock_exec.logs.stderr = []
-    mock_exec.error = None
-    mock_exec.results = []
-
-    assert e2b_runtime.sandbox is not None
-    e2b_runtime.sandbox.run_code.return_value = mock_exec
-
-    entry_existing = MagicMock()
-    entry_existing.name = "config.json"
-    entry_modified = MagicMock()
-    entry_modified.name = "data.csv"
-
-    e2b_runtime.sandbox.files.list.side_effect = [
-        [entry_existing, entry_modified],  # Before
-        [entry_modified],  # After (config.json gone)
-    ]
-
-    e2b_runtime.sandbox.files.read.return_value = b"content"
-
-    result = await e2b_runtime.execute("delete_and_modify()", "python", mock_user_context, "sid")
-
-    assert len(result.artifacts) == 0
-
-
-@pytest.mark.asyncio
 async def test_execute_python_timeout(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
     """Test that execution enforces timeout."""
     e2b_runtime.timeout = 0.1
 
-    def long_running_code(*args: Any, **kwargs: Any) -> Any:
+    def long_running_code(*args: Any, **kwargs: Any) -> None:
+        # The timeout fires first, so the return value is never read
         time.sleep(0.2)
-        return MagicMock()
 
     assert e2b_runtime.sandbox is not None
     e2b_runtime.sandbox.run_code.side_effect = long_running_code
 
-    with pytest.raises(TimeoutError, match="Execution exceeded 0.1 seconds limit"):
+    with pytest.raises(TimeoutError, match=_TIMED_OUT):
         await e2b_runtime.execute("while True: pass", "python", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
 async def test_execute_bash_timeout(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
     """Test that bash execution enforces timeout."""
     e2b_runtime.timeout = 0.1
 
-    def long_running_code(*args: Any, **kwargs: Any) -> Any:
+    def long_running_code(*args: Any, **kwargs: Any) -> None:
         time.sleep(0.2)
-        return MagicMock()
 
     assert e2b_runtime.sandbox is not None
     e2b_runtime.sandbox.commands.run.side_effect = long_running_code
 
-    with pytest.raises(TimeoutError, match="Execution exceeded 0.1 seconds limit"):
+    with pytest.raises(TimeoutError, match=_TIMED_OUT):
         await e2b_runtime.execute("sleep 10", "bash", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
 async def test_execute_r_timeout(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
     """Test that R execution enforces timeout."""
     e2b_runtime.timeout = 0.1
 
-    def long_running_code(*args: Any, **kwargs: Any) -> Any:
+    def long_running_code(*args: Any, **kwargs: Any) -> None:
         time.sleep(0.2)
-        return MagicMock()
 
     assert e2b_runtime.sandbox is not None
     e2b_runtime.sandbox.commands.run.side_effect = long_running_code
 
-    with pytest.raises(TimeoutError, match="Execution exceeded 0.1 seconds limit"):
+    with pytest.raises(TimeoutError, match=_TIMED_OUT):
         await e2b_runtime.execute("Sys.sleep(10)", "r", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
-async def test_start_idempotency_with_restart(e2b_runtime: E2BRuntime) -> None:
+async def test_start_idempotency_with_restart(e2b_runtime: E2BRuntime, mock_e2b_sandbox: Any) -> None:
     """Test that calling start() on a running sandbox terminates the old one first."""
     assert e2b_runtime.sandbox is not None
     old_sandbox = e2b_runtime.sandbox
 
-    # Mock close to verify it's called
-    old_sandbox.close = MagicMock()
+    # The constructor returns a NEW sandbox on restart
+    new_sandbox_mock = _make_sandbox("new_id")
+    mock_e2b_sandbox.return_value = new_sandbox_mock
 
-    # We need to mock Sandbox constructor again to return a NEW sandbox
-    with patch("coreason_sandbox.runtimes.e2b.E2BSandbox") as mock_new_sandbox_cls:
-        new_sandbox_mock = MagicMock()
-        new_sandbox_mock.sandbox_id = "new_id"
-        mock_new_sandbox_cls.return_value = new_sandbox_mock
+    await e2b_runtime.start()
 
-        await e2b_runtime.start()
+    # Verify old sandbox was killed
+    old_sandbox.kill.assert_called_once()
 
-        # Verify old sandbox was closed
-        old_sandbox.close.assert_called_once()
+    # Verify new sandbox is set
+    assert e2b_runtime.sandbox is new_sandbox_mock
+    assert e2b_runtime.sandbox.sandbox_id == "new_id"
 
-        # Verify new sandbox is set
-        assert e2b_runtime.sandbox == new_sandbox_mock
-        assert e2b_runtime.sandbox.sandbox_id == "new_id"
 
-
-@pytest.mark.asyncio
 async def test_execute_sequential_persistence(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
     """Verify multiple execute calls use the same sandbox instance."""
     assert e2b_runtime.sandbox is not None
     original_sandbox = e2b_runtime.sandbox
 
     # Mock result 1
-    mock_exec1 = MagicMock()
-    mock_exec1.logs.stdout = [MagicMock(content="step1")]
-    mock_exec1.logs.stderr = []
-    mock_exec1.error = None
-    mock_exec1.results = []
+    mock_exec1 = _exec(stdout=["step1"])
 
     # Mock result 2
-    mock_exec2 = MagicMock()
-    mock_exec2.logs.stdout = [MagicMock(content="step2")]
-    mock_exec2.logs.stderr = []
-    mock_exec2.error = None
-    mock_exec2.results = []
+    mock_exec2 = _exec(stdout=["step2"])
 
     e2b_runtime.sandbox.run_code.side_effect = [mock_exec1, mock_exec2]
 
@@ -558,29 +426,18 @@ async def test_execute_sequential_persistence(e2b_runtime: E2BRuntime, mock_user
 
     # Verify sandbox instance didn't change
     assert e2b_runtime.sandbox is original_sandbox
-    # Verify run_code called twice on same instance
-    assert e2b_runtime.sandbox.run_code.call_count == 2
 
 
-@pytest.mark.asyncio
 async def test_execute_error_persistence(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
     """Verify non-fatal error doesn't restart sandbox."""
     assert e2b_runtime.sandbox is not None
     original_sandbox = e2b_runtime.sandbox
 
     # Mock error execution (e.g. syntax error)
-    mock_exec_err = MagicMock()
-    mock_exec_err.logs.stdout = []
-    mock_exec_err.logs.stderr = []
-    mock_exec_err.error = MagicMock(name="SyntaxError", value="invalid syntax", traceback="")
-    mock_exec_err.results = []
+    mock_exec_err = _exec(error=MagicMock(name="SyntaxError", value="invalid syntax", traceback=""))
 
     # Mock success execution
-    mock_exec_ok = MagicMock()
-    mock_exec_ok.logs.stdout = [MagicMock(content="ok")]
-    mock_exec_ok.logs.stderr = []
-    mock_exec_ok.error = None
-    mock_exec_ok.results = []
+    mock_exec_ok = _exec(stdout=["ok"])
 
     e2b_runtime.sandbox.run_code.side_effect = [mock_exec_err, mock_exec_ok]
 
@@ -596,25 +453,20 @@ async def test_execute_error_persistence(e2b_runtime: E2BRuntime, mock_user_cont
     assert e2b_runtime.sandbox is original_sandbox
 
 
-@pytest.mark.asyncio
 async def test_concurrent_terminate_during_execute(e2b_runtime: E2BRuntime, mock_user_context: Any) -> None:
     """Simulate terminate being called while execute is waiting."""
     assert e2b_runtime.sandbox is not None
 
-    def side_effect(*args: Any, **kwargs: Any) -> MagicMock:
-        time.sleep(0.2)
-        return MagicMock(logs=MagicMock(stdout=[], stderr=[]), error=None, results=[])
-
-    e2b_runtime.sandbox.run_code.side_effect = side_effect
+    loop = asyncio.get_running_loop()
 
-    # Start execute task
-    exec_task = asyncio.create_task(e2b_runtime.execute("sleep", "python", mock_user_context, "sid"))
+    def side_effect(*args: Any, **kwargs: Any) -> SimpleNamespace:
+        # run_code executes in a worker thread; terminate on the loop while it is still in flight
+        asyncio.run_coroutine_threadsafe(e2b_runtime.terminate(), loop).result(timeout=5)
+        return _exec()
 
-    # Wait a bit then terminate
-    await asyncio.sleep(0.05)
-    await e2b_runtime.terminate()
+    e2b_runtime.sandbox.run_code.side_effect = side_effect
 
-    result = await exec_task
+    result = await e2b_runtime.execute("sleep", "python", mock_user_context, "sid")
 
     assert e2b_runtime.sandbox is None
     assert result.exit_code == 0
@@ -1,5 +1,8 @@
+from typing import Any, Generator, Literal
 from unittest.mock import patch
 
+import docker
+import pytest
 from coreason_sandbox.config import SandboxConfig
 from coreason_sandbox.factory import SandboxFactory
 from coreason_sandbox.runtime import SandboxRuntime
@@ -7,33 +10,29 @@ from coreason_sandbox.runtimes.docker import DockerRuntime
 from coreason_sandbox.runtimes.e2b import E2BRuntime
 
 
-def test_factory_returns_docker_runtime() -> None:
-    config = SandboxConfig(runtime="docker")
-    with patch("coreason_sandbox.runtimes.docker.docker.from_env"):
-        runtime = SandboxFactory.get_runtime(config)
-        assert isinstance(runtime, DockerRuntime)
-        assert isinstance(runtime, SandboxRuntime)
+@pytest.fixture
+def mock_docker_from_env() -> Generator[Any, None, None]:
+    with patch.object(docker, "from_env") as mock:
+        yield mock
 
 
-def test_factory_returns_e2b_runtime() -> None:
-    config = SandboxConfig(runtime="e2b")
-    # E2B runtime might not need mocking if it only sets api_key in init,
-    # but to be safe/clean if logic changes:
+@pytest.mark.parametrize("runtime_name, runtime_cls", [("docker", DockerRuntime), ("e2b", E2BRuntime)])
+def test_factory_returns_runtime(
+    mock_docker_from_env: Any, runtime_name: Literal["docker", "e2b"], runtime_cls: type
+) -> None:
+    config = SandboxConfig(runtime=runtime_name)
     runtime = SandboxFactory.get_runtime(config)
-    assert isinstance(runtime, E2BRuntime)
+    assert isinstance(runtime, runtime_cls)
     assert isinstance(runtime, SandboxRuntime)
 
 
-def test_factory_wires_s3_storage() -> None:
+def test_factory_wires_s3_storage(mock_docker_from_env: Any) -> None:
     config = SandboxConfig(
         runtime="docker",
         s3_bucket="my-bucket",
         s3_region="us-east-1",
     )
-    with (
-        patch("coreason_sandbox.runtimes.docker.docker.from_env"),
-        patch("coreason_sandbox.factory.S3Storage") as MockS3,
-    ):
+    with patch("coreason_sandbox.factory.S3Storage") as MockS3:
         runtime = SandboxFactory.get_runtime(config)
 
         # Check S3Storage initialized
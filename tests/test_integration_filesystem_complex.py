@@ -1,4 +1,6 @@
+import hashlib
 import os
+from pathlib import Path
 from typing import AsyncGenerator
 
 import docker
@@ -7,22 +9,60 @@ import pytest_asyncio
 from coreason_identity.models import UserContext
 from coreason_sandbox.runtimes.docker import DockerRuntime
 
+# Files the Dockerfile copies into the image; the image is rebuilt when any of them change.
+BUILD_INPUTS = ("Dockerfile", "pyproject.toml", "README.md", "LICENSE", "src")
+BUILD_HASH_LABEL = "coreason.sandbox.build-hash"
+
+
+def build_fingerprint(project_root: Path) -> str:
+    """Hash the image build inputs so an existing image can be reused when nothing changed."""
+    digest = hashlib.sha256()
+    for name in BUILD_INPUTS:
+        root = project_root / name
+        paths = (
+            sorted(p for p in root.rglob("*") if p.is_file() and "__pycache__" not in p.parts)
+            if root.is_dir()
+            else [root]
+        )
+        for path in paths:
+            digest.update(path.relative_to(project_root).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
 
 @pytest_asyncio.fixture(scope="module")
-async def built_docker_image() -> AsyncGenerator[str, None]:
+async def built_docker_image(docker_client: docker.DockerClient) -> AsyncGenerator[str, None]:
     """
     Builds the Docker image from the project Dockerfile for testing.
+    Reuses an existing image whose build inputs are unchanged unless
+    FORCE_REBUILD_SANDBOX_IMAGE=1 is set.
     Returns the image tag.
     """
     image_tag = "coreason-sandbox-test:latest"
 
     try:
-        client = docker.from_env()
-        # Build image
+        client = docker_client
         # This assumes the test is run from the project root
-        project_root = os.getcwd()
+        project_root = Path.cwd()
+        fingerprint = build_fingerprint(project_root)
+
+        if os.environ.get("FORCE_REBUILD_SANDBOX_IMAGE") != "1":
+            try:
+                existing = client.images.get(image_tag)
+            except docker.errors.ImageNotFound:
+                existing = None
+            if existing is not None and existing.labels.get(BUILD_HASH_LABEL) == fingerprint:
+                yield image_tag
+                return
+
         print(f"Building Docker image from {project_root}...")
-        client.images.build(path=project_root, dockerfile="Dockerfile", tag=image_tag, rm=True)
+        client.images.build(
+            path=str(project_root),
+            dockerfile="Dockerfile",
+            tag=image_tag,
+            rm=True,
+            labels={BUILD_HASH_LABEL: fingerprint},
+        )
         yield image_tag
     except (docker.errors.BuildError, docker.errors.APIError, docker.errors.DockerException) as e:
         pytest.skip(f"Failed to build/connect Docker: {e}")
@@ -31,11 +71,14 @@ async def built_docker_image() -> AsyncGenerator[str, None]:
         pass
 
 
-@pytest_asyncio.fixture
-async def filesystem_docker_runtime(built_docker_image: str) -> AsyncGenerator[DockerRuntime, None]:
+@pytest_asyncio.fixture(scope="module")
+async def filesystem_docker_runtime(
+    built_docker_image: str, docker_client: docker.DockerClient
+) -> AsyncGenerator[DockerRuntime, None]:
+    """One container shared by every test in this module."""
     runtime = None
     try:
-        runtime = DockerRuntime(image=built_docker_image, timeout=30.0)
+        runtime = DockerRuntime(image=built_docker_image, timeout=30.0, client=docker_client)
         await runtime.start()
         yield runtime
     except (docker.errors.ImageNotFound, docker.errors.DockerException, docker.errors.APIError) as e:
@@ -45,31 +88,50 @@ async def filesystem_docker_runtime(built_docker_image: str) -> AsyncGenerator[D
             await runtime.terminate()
 
 
-@pytest.mark.live
-@pytest.mark.asyncio
-async def test_verify_user_identity(filesystem_docker_runtime: DockerRuntime, mock_user_context: UserContext) -> None:
-    """Verify the container is running as 'user' with the correct home."""
-    runtime = filesystem_docker_runtime
+CHECK_MARK = "---CHECK:"
+EXIT_MARK = "---EXIT:"
+
+
+async def run_checks(
+    runtime: DockerRuntime, checks: dict[str, str], context: UserContext
+) -> dict[str, tuple[int, str]]:
+    """Run several bash checks in a single exec and return (exit_code, combined output) per check."""
+    script = "\n".join(f'echo "{CHECK_MARK}{name}"; ({cmd}) 2>&1; echo "{EXIT_MARK}$?"' for name, cmd in checks.items())
+    result = await runtime.execute(script, "bash", context, "sid")
 
-    # 1. Check User
-    res_user = await runtime.execute("whoami", "bash", mock_user_context, "sid")
-    assert res_user.exit_code == 0
-    assert res_user.stdout.strip() == "user"
+    parsed: dict[str, tuple[int, str]] = {}
+    for chunk in result.stdout.split(CHECK_MARK)[1:]:
+        name, _, rest = chunk.partition("\n")
+        output, _, exit_code = rest.rpartition(EXIT_MARK)
+        parsed[name] = (int(exit_code.strip()), output.strip())
+    assert parsed.keys() == checks.keys(), result
+    return parsed
 
-    # 2. Check Home Env
-    res_home = await runtime.execute("echo $HOME", "bash", mock_user_context, "sid")
-    assert res_home.exit_code == 0
-    assert res_home.stdout.strip() == "/home/user"
 
-    # 3. Check ID
-    res_id = await runtime.execute("id -u", "bash", mock_user_context, "sid")
-    assert res_id.exit_code == 0
+@pytest_asyncio.fixture(autouse=True)
+async def clean_home(filesystem_docker_runtime: DockerRuntime, mock_user_context: UserContext) -> None:
+    """Reset the shared container's home directory so each test starts from a clean slate."""
+    await filesystem_docker_runtime.execute("rm -rf /home/user/*", "bash", mock_user_context, "sid")
+
+
+@pytest.mark.live
+async def test_verify_user_identity(filesystem_docker_runtime: DockerRuntime, mock_user_context: UserContext) -> None:
+    """Verify the container is running as 'user' with the correct home."""
+    results = await run_checks(
+        filesystem_docker_runtime,
+        {"user": "whoami", "home": "echo $HOME", "uid": "id -u"},
+        mock_user_context,
+    )
+
+    assert results["user"] == (0, "user")
+    assert results["home"] == (0, "/home/user")
     # The uid for a created user is usually 1000, ensuring it's not 0 (root)
-    assert res_id.stdout.strip() != "0"
+    exit_code, uid = results["uid"]
+    assert exit_code == 0
+    assert uid != "0"
 
 
 @pytest.mark.live
-@pytest.mark.asyncio
 async def test_working_directory_default(
     filesystem_docker_runtime: DockerRuntime, mock_user_context: UserContext
 ) -> None:
@@ -88,60 +150,58 @@ async def test_working_directory_default(
 
 
 @pytest.mark.live
-@pytest.mark.asyncio
 async def test_permission_boundaries(filesystem_docker_runtime: DockerRuntime, mock_user_context: UserContext) -> None:
     """Verify that the user cannot write to root-owned paths."""
-    runtime = filesystem_docker_runtime
+    results = await run_checks(
+        filesystem_docker_runtime,
+        {"root": "touch /root/hack.txt", "usr": "touch /usr/hack.txt"},
+        mock_user_context,
+    )
 
-    # Attempt to write to /root
-    res_root = await runtime.execute("touch /root/hack.txt", "bash", mock_user_context, "sid")
-    assert res_root.exit_code != 0
-    # Different systems report perm denied differently in stderr/stdout/exit code
-    assert "Permission denied" in res_root.stderr or "Permission denied" in res_root.stdout or res_root.exit_code == 1
+    exit_code, output = results["root"]
+    assert exit_code != 0
+    # Different systems report perm denied differently in output/exit code
+    assert "Permission denied" in output or exit_code == 1
 
-    # Attempt to write to /usr
-    res_usr = await runtime.execute("touch /usr/hack.txt", "bash", mock_user_context, "sid")
-    assert res_usr.exit_code != 0
+    exit_code, _ = results["usr"]
+    assert exit_code != 0
 
 
 @pytest.mark.live
-@pytest.mark.asyncio
 async def test_subdirectory_persistence_and_listing(
     filesystem_docker_runtime: DockerRuntime, mock_user_context: UserContext
 ) -> None:
     """Verify creating subdirectories and files works as expected in user home."""
     runtime = filesystem_docker_runtime
 
-    # 1. Create Subdir
-    await runtime.execute("mkdir -p subdir/nested", "bash", mock_user_context, "sid")
-
-    # 2. Write file
-    await runtime.execute("echo 'secret' > subdir/nested/file.txt", "bash", mock_user_context, "sid")
-
-    # 3. List files via Runtime API (using relative path)
+    # 1. Create subdir, write a file and read it back
+    results = await run_checks(
+        runtime,
+        {
+            "write": "mkdir -p subdir/nested && echo 'secret' > subdir/nested/file.txt",
+            "cat": "cat subdir/nested/file.txt",
+        },
+        mock_user_context,
+    )
+    assert results["write"][0] == 0
+    assert results["cat"] == (0, "secret")
+
+    # 2. List files via Runtime API (using relative path)
     files = await runtime.list_files("subdir/nested", mock_user_context, "sid")
     assert "file.txt" in files
 
-    # 4. Verify Content
-    res_cat = await runtime.execute("cat subdir/nested/file.txt", "bash", mock_user_context, "sid")
-    assert res_cat.stdout.strip() == "secret"
-
 
 @pytest.mark.live
-@pytest.mark.asyncio
 async def test_python_path_consistency(
     filesystem_docker_runtime: DockerRuntime, mock_user_context: UserContext
 ) -> None:
     """Verify that Python environment is healthy in the new user context."""
     runtime = filesystem_docker_runtime
 
-    # Ensure pip is available and user can install (if simulated) or at least check version
-    res_pip = await runtime.execute("pip --version", "bash", mock_user_context, "sid")
-    assert res_pip.exit_code == 0
-
-    # Ensure we are using the system/local python
-    res_which = await runtime.execute("which python", "bash", mock_user_context, "sid")
-    assert res_which.exit_code == 0
+    # Ensure pip is available and we are using the system/local python
+    results = await run_checks(runtime, {"pip": "pip --version", "which": "which python"}, mock_user_context)
+    assert results["pip"][0] == 0
+    assert results["which"][0] == 0
 
     # Verify we can write pyc files (implied by execution usually, but good to check write permissions in execution dir)
     res_py = await runtime.execute("import sys; print(sys.executable)", "python", mock_user_context, "sid")
@@ -8,26 +8,28 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_sandbox
 
-import base64
 from typing import Generator
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
-from coreason_sandbox.main import execute_code, install_package, list_files, main
+from coreason_sandbox.main import execute_code, install_package, list_files, main, mcp
+from coreason_sandbox.mcp import SandboxMCP
 from mcp.types import ImageContent, TextContent
 
 
+@pytest.fixture(scope="module")
+def _shared_sandbox() -> MagicMock:
+    # Built once per module and reset per test; spec'd so the async methods come back as AsyncMocks
+    return MagicMock(spec=SandboxMCP)
+
+
 @pytest.fixture
-def mock_sandbox() -> Generator[MagicMock, None, None]:
-    with patch("coreason_sandbox.main.sandbox", new_callable=MagicMock) as mock:
-        # Configure methods to be awaitable
-        mock.execute_code = AsyncMock()
-        mock.install_package = AsyncMock()
-        mock.list_files = AsyncMock()
-        yield mock
+def mock_sandbox(_shared_sandbox: MagicMock) -> Generator[MagicMock, None, None]:
+    _shared_sandbox.reset_mock(return_value=True, side_effect=True)
+    with patch("coreason_sandbox.main.sandbox", new=_shared_sandbox):
+        yield _shared_sandbox
 
 
-@pytest.mark.asyncio
 async def test_execute_code_text_only(mock_sandbox: MagicMock) -> None:
     # Setup
     mock_sandbox.execute_code.return_value = {
@@ -50,7 +52,6 @@ async def test_execute_code_text_only(mock_sandbox: MagicMock) -> None:
     assert result[2].text == "Duration: 1.2346s"
 
 
-@pytest.mark.asyncio
 async def test_execute_code_stderr(mock_sandbox: MagicMock) -> None:
     # Setup
     mock_sandbox.execute_code.return_value = {
@@ -70,12 +71,9 @@ async def test_execute_code_stderr(mock_sandbox: MagicMock) -> None:
     assert result[1].text == "Exit Code: 1"
 
 
-@pytest.mark.asyncio
-async def test_execute_code_with_image(mock_sandbox: MagicMock) -> None:
+async def test_execute_code_with_image(mock_sandbox: MagicMock, image_artifact: tuple[bytes, str, str]) -> None:
     # Setup
-    img_bytes = b"fake_image_data"
-    b64_img = base64.b64encode(img_bytes).decode("utf-8")
-    data_url = f"data:image/png;base64,{b64_img}"
+    _, b64_img, data_url = image_artifact
 
     mock_sandbox.execute_code.return_value = {
         "stdout": "",
@@ -106,12 +104,11 @@ async def test_execute_code_with_image(mock_sandbox: MagicMock) -> None:
     assert img_result.mimeType == "image/png"
 
 
-@pytest.mark.asyncio
-async def test_execute_code_with_image_missing_content_type(mock_sandbox: MagicMock) -> None:
+async def test_execute_code_with_image_missing_content_type(
+    mock_sandbox: MagicMock, image_artifact: tuple[bytes, str, str]
+) -> None:
     # Setup
-    img_bytes = b"fake_image_data"
-    b64_img = base64.b64encode(img_bytes).decode("utf-8")
-    data_url = f"data:image/png;base64,{b64_img}"
+    _, _, data_url = image_artifact
 
     mock_sandbox.execute_code.return_value = {
         "stdout": "",
@@ -136,7 +133,6 @@ async def test_execute_code_with_image_missing_content_type(mock_sandbox: MagicM
     assert img_result.mimeType == "image/png"
 
 
-@pytest.mark.asyncio
 async def test_execute_code_malformed_image_url(mock_sandbox: MagicMock) -> None:
     # Setup
     mock_sandbox.execute_code.return_value = {
@@ -160,7 +156,6 @@ async def test_execute_code_malformed_image_url(mock_sandbox: MagicMock) -> None
     assert "Failed to process image artifact" in result[2].text
 
 
-@pytest.mark.asyncio
 async def test_execute_code_with_non_image_artifact(mock_sandbox: MagicMock) -> None:
     # Setup
     mock_sandbox.execute_code.return_value = {
@@ -185,7 +180,6 @@ async def test_execute_code_with_non_image_artifact(mock_sandbox: MagicMock) ->
     assert "Artifact: data.csv (https://s3.bucket/data.csv)" in result[2].text
 
 
-@pytest.mark.asyncio
 async def test_execute_code_exception(mock_sandbox: MagicMock) -> None:
     mock_sandbox.execute_code.side_effect = Exception("Boom")
 
@@ -195,28 +189,24 @@ async def test_execute_code_exception(mock_sandbox: MagicMock) -> None:
     assert "Error executing code: Boom" in result[0].text
 
 
-@pytest.mark.asyncio
 async def test_install_package(mock_sandbox: MagicMock) -> None:
     mock_sandbox.install_package.return_value = "Success"
     result = await install_package("sess", "pandas")
     assert result == "Success"
 
 
-@pytest.mark.asyncio
 async def test_install_package_exception(mock_sandbox: MagicMock) -> None:
     mock_sandbox.install_package.side_effect = Exception("Fail")
     result = await install_package("sess", "pandas")
     assert "Error installing package: Fail" in result
 
 
-@pytest.mark.asyncio
 async def test_list_files(mock_sandbox: MagicMock) -> None:
     mock_sandbox.list_files.return_value = ["file1", "file2"]
     result = await list_files("sess", ".")
     assert result == ["file1", "file2"]
 
 
-@pytest.mark.asyncio
 async def test_list_files_exception(mock_sandbox: MagicMock) -> None:
     mock_sandbox.list_files.side_effect = Exception("Fail")
     result = await list_files("sess", ".")
@@ -224,6 +214,11 @@ async def test_list_files_exception(mock_sandbox: MagicMock) -> None:
 
 
 def test_main_execution() -> None:
-    with patch("coreason_sandbox.main.mcp.run") as mock_run:
+    # Shadow the bound method on the instance; deleting it restores the class attribute
+    mock_run = MagicMock()
+    mcp.run = mock_run  # type: ignore[method-assign]
+    try:
         main()
         mock_run.assert_called_once()
+    finally:
+        del mcp.run
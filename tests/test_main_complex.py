@@ -8,29 +8,32 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_sandbox
 
-import base64
-from typing import Generator
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Generator, cast
+from unittest.mock import MagicMock, patch
 
 import pytest
 from coreason_sandbox.main import execute_code
+from coreason_sandbox.mcp import SandboxMCP
 from mcp.types import ImageContent, TextContent
 
 
+@pytest.fixture(scope="module")
+def _shared_sandbox() -> MagicMock:
+    return MagicMock(spec=SandboxMCP)
+
+
 @pytest.fixture
-def mock_sandbox() -> Generator[MagicMock, None, None]:
-    with patch("coreason_sandbox.main.sandbox", new_callable=MagicMock) as mock:
-        mock.execute_code = AsyncMock()
-        yield mock
+def mock_sandbox(_shared_sandbox: MagicMock) -> Generator[MagicMock, None, None]:
+    _shared_sandbox.reset_mock(return_value=True, side_effect=True)
+    with patch("coreason_sandbox.main.sandbox", new=_shared_sandbox):
+        yield _shared_sandbox
 
 
-@pytest.mark.asyncio
-async def test_execute_code_mixed_response(mock_sandbox: MagicMock) -> None:
+async def test_execute_code_mixed_response(mock_sandbox: MagicMock, image_artifact: tuple[bytes, str, str]) -> None:
     """
     Test a complex response with stdout, stderr, an image, and a file link.
     """
-    img_bytes = b"image_data"
-    b64_img = base64.b64encode(img_bytes).decode("utf-8")
+    _, b64_img, _ = image_artifact
     data_url = f"data:image/jpeg;base64,{b64_img}"
 
     mock_sandbox.execute_code.return_value = {
@@ -56,18 +59,12 @@ async def test_execute_code_mixed_response(mock_sandbox: MagicMock) -> None:
 
     assert len(result) == 6  # Stdout, Stderr, Exit, Duration, Image, Link
 
-    # Verify types and content
-    assert isinstance(result[0], TextContent)
-    assert "Standard Output" in result[0].text
-
-    assert isinstance(result[1], TextContent)
-    assert "Standard Error" in result[1].text
-
-    assert isinstance(result[2], TextContent)
-    assert "Exit Code: 0" in result[2].text
-
-    assert isinstance(result[3], TextContent)
-    assert "Duration: 1.5000s" in result[3].text
+    # The summary block is always text; only the artifacts need a type check
+    stdout, stderr, exit_code, duration = cast(list[TextContent], result[:4])
+    assert "Standard Output" in stdout.text
+    assert "Standard Error" in stderr.text
+    assert "Exit Code: 0" in exit_code.text
+    assert "Duration: 1.5000s" in duration.text
 
     # Image Artifact
     assert isinstance(result[4], ImageContent)
@@ -80,7 +77,6 @@ async def test_execute_code_mixed_response(mock_sandbox: MagicMock) -> None:
     assert "https://s3.bucket/data.csv" in result[5].text
 
 
-@pytest.mark.asyncio
 async def test_execute_code_artifact_edge_cases(mock_sandbox: MagicMock) -> None:
     """
     Test edge cases: missing fields, invalid base64, unknown structure.
@@ -116,20 +112,19 @@ async def test_execute_code_artifact_edge_cases(mock_sandbox: MagicMock) -> None
     assert len(result) == 4
 
     # Case 1
-    assert isinstance(result[1], TextContent)
-    assert "Artifact: missing_url.txt (No URL)" in result[1].text
+    missing_url = cast(TextContent, result[1])
+    assert "Artifact: missing_url.txt (No URL)" in missing_url.text
 
-    # Case 2
+    # Case 2 (an image artifact must degrade to text)
     assert isinstance(result[2], TextContent)
     assert "Failed to process image artifact corrupt.png" in result[2].text
 
     # Case 3
-    assert isinstance(result[3], TextContent)
-    assert "Artifact: unknown" in result[3].text
-    assert "http://example.com/file" in result[3].text
+    unknown = cast(TextContent, result[3])
+    assert "Artifact: unknown" in unknown.text
+    assert "http://example.com/file" in unknown.text
 
 
-@pytest.mark.asyncio
 async def test_execute_code_unicode(mock_sandbox: MagicMock) -> None:
     """
     Test preservation of Unicode characters.
@@ -144,5 +139,4 @@ async def test_execute_code_unicode(mock_sandbox: MagicMock) -> None:
 
     result = await execute_code("session-unicode", "python", "print('🚀')")
 
-    assert isinstance(result[0], TextContent)
-    assert f"STDOUT:\n{unicode_str}" == result[0].text
+    assert f"STDOUT:\n{unicode_str}" == cast(TextContent, result[0]).text
@@ -1,14 +1,11 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
-import pytest
+from coreason_sandbox.mcp import SandboxMCP
 
 
-@pytest.mark.asyncio
 async def test_lifespan_calls_shutdown() -> None:
     # Patch the global sandbox in src.coreason_sandbox.main
-    with patch("coreason_sandbox.main.sandbox") as mock_sandbox:
-        mock_sandbox.shutdown = AsyncMock()
-
+    with patch("coreason_sandbox.main.sandbox", spec=SandboxMCP) as mock_sandbox:
         # Import lifespan from main
         from coreason_sandbox.main import lifespan
 
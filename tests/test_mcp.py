@@ -1,55 +1,32 @@
 from typing import Any, cast
-from unittest.mock import AsyncMock, patch
 
 import pytest
 from coreason_sandbox.mcp import SandboxMCP
 from coreason_sandbox.models import ExecutionResult, FileReference
 
+pytestmark = pytest.mark.usefixtures("no_reaper")
 
-@pytest.fixture
-def mock_runtime() -> Any:
-    runtime = AsyncMock()
-    runtime.start = AsyncMock()
-    runtime.terminate = AsyncMock()
-    runtime.execute = AsyncMock()
-    runtime.install_package = AsyncMock()
-    runtime.list_files = AsyncMock()
-    return runtime
+_RESULT_WITH_ARTIFACT = ExecutionResult.model_construct(
+    stdout="out",
+    stderr="err",
+    exit_code=0,
+    artifacts=[FileReference.model_construct(filename="plot.png", path="p", url="http://url")],
+    execution_duration=1.0,
+)
 
 
-@pytest.fixture
-def mock_factory(mock_runtime: Any) -> Any:
-    with patch("coreason_sandbox.session_manager.SandboxFactory.get_runtime", return_value=mock_runtime) as mock:
-        yield mock
-
-
-@pytest.fixture
-def mock_veritas() -> Any:
-    with patch("coreason_sandbox.mcp.VeritasIntegrator") as mock:
-        mock.return_value.log_pre_execution = AsyncMock()
-        yield mock
-
-
-@pytest.mark.asyncio
 async def test_mcp_execute_code(
-    mock_factory: Any, mock_runtime: Any, mock_veritas: Any, mock_user_context: Any
+    mock_factory: Any, mock_runtime: Any, mock_veritas: Any, mock_user_context: Any, fresh_mcp: SandboxMCP
 ) -> None:
-    mcp = SandboxMCP()
     session_id = "test_session"
 
-    mock_runtime.execute.return_value = ExecutionResult(
-        stdout="out",
-        stderr="err",
-        exit_code=0,
-        artifacts=[FileReference(filename="plot.png", path="p", url="http://url")],
-        execution_duration=1.0,
-    )
+    mock_runtime.execute.return_value = _RESULT_WITH_ARTIFACT
 
-    result = await mcp.execute_code(session_id, "python", "print('hi')", mock_user_context)
+    result = await fresh_mcp.execute_code(session_id, "python", "print('hi')", mock_user_context)
 
     # Verify auto-start
     mock_runtime.start.assert_called_once()
-    assert session_id in mcp.sessions
+    assert session_id in fresh_mcp.sessions
 
     # Verify Veritas logging
     mock_veritas.return_value.log_pre_execution.assert_called_with("print('hi')", "python")
@@ -64,50 +41,48 @@ async def test_mcp_execute_code(
     assert artifacts[0]["url"] == "http://url"
 
 
-@pytest.mark.asyncio
-async def test_mcp_install_package(mock_factory: Any, mock_runtime: Any, mock_user_context: Any) -> None:
-    mcp = SandboxMCP()
+async def test_mcp_install_package(
+    mock_factory: Any, mock_runtime: Any, mock_user_context: Any, fresh_mcp: SandboxMCP
+) -> None:
     session_id = "test_session"
 
-    resp = await mcp.install_package(session_id, "requests", mock_user_context)
+    resp = await fresh_mcp.install_package(session_id, "requests", mock_user_context)
 
     mock_runtime.start.assert_called_once()
     mock_runtime.install_package.assert_called_with("requests", mock_user_context, session_id)
     assert "installed successfully" in resp
-    assert session_id in mcp.sessions
+    assert session_id in fresh_mcp.sessions
 
 
-@pytest.mark.asyncio
-async def test_mcp_list_files(mock_factory: Any, mock_runtime: Any, mock_user_context: Any) -> None:
-    mcp = SandboxMCP()
+async def test_mcp_list_files(
+    mock_factory: Any, mock_runtime: Any, mock_user_context: Any, fresh_mcp: SandboxMCP
+) -> None:
     session_id = "test_session"
     mock_runtime.list_files.return_value = ["file1", "file2"]
 
-    files = await mcp.list_files(session_id, mock_user_context, "/home")
+    files = await fresh_mcp.list_files(session_id, mock_user_context, "/home")
 
     mock_runtime.start.assert_called_once()
     mock_runtime.list_files.assert_called_with("/home", mock_user_context, session_id)
     assert files == ["file1", "file2"]
-    assert session_id in mcp.sessions
+    assert session_id in fresh_mcp.sessions
 
 
-@pytest.mark.asyncio
-async def test_mcp_shutdown(mock_factory: Any, mock_runtime: Any, mock_user_context: Any) -> None:
-    mcp = SandboxMCP()
+async def test_mcp_shutdown(
+    mock_factory: Any, mock_runtime: Any, mock_user_context: Any, fresh_mcp: SandboxMCP
+) -> None:
     session_id = "test_session"
 
     # Initialize a session
-    await mcp.execute_code(session_id, "python", "pass", mock_user_context)
-    assert session_id in mcp.sessions
+    await fresh_mcp.execute_code(session_id, "python", "pass", mock_user_context)
+    assert session_id in fresh_mcp.sessions
 
-    await mcp.shutdown()
+    await fresh_mcp.shutdown()
 
     mock_runtime.terminate.assert_called_once()
-    assert len(mcp.sessions) == 0
+    assert len(fresh_mcp.sessions) == 0
 
 
-@pytest.mark.asyncio
-async def test_mcp_shutdown_no_sessions(mock_factory: Any, mock_runtime: Any) -> None:
-    mcp = SandboxMCP()
-    await mcp.shutdown()
+async def test_mcp_shutdown_no_sessions(mock_factory: Any, mock_runtime: Any, fresh_mcp: SandboxMCP) -> None:
+    await fresh_mcp.shutdown()
     mock_runtime.terminate.assert_not_called()
@@ -1,54 +1,34 @@
 import asyncio
 from typing import Any
-from unittest.mock import AsyncMock, patch
 
 import pytest
 from coreason_sandbox.mcp import SandboxMCP
-from coreason_sandbox.models import ExecutionResult
 
-
-@pytest.fixture
-def mock_runtime() -> Any:
-    runtime = AsyncMock()
-    runtime.start = AsyncMock()
-    runtime.terminate = AsyncMock()
-    runtime.execute.return_value = ExecutionResult(
-        stdout="", stderr="", exit_code=0, artifacts=[], execution_duration=0.1
-    )
-    return runtime
+pytestmark = pytest.mark.usefixtures("no_reaper", "mock_veritas")
 
 
 @pytest.fixture
-def mock_factory(mock_runtime: Any) -> Any:
-    with patch("coreason_sandbox.session_manager.SandboxFactory.get_runtime", return_value=mock_runtime) as mock:
-        yield mock
+def mock_runtime(fake_runtime: Any) -> Any:
+    # Nothing here inspects runtime calls, so the plain async stub stands in for AsyncMock
+    return fake_runtime
 
 
-@pytest.fixture(autouse=True)
-def mock_veritas() -> Any:
-    with patch("coreason_sandbox.mcp.VeritasIntegrator") as mock:
-        mock.return_value.log_pre_execution = AsyncMock()
-        yield mock
-
-
-@pytest.mark.asyncio
 async def test_complex_concurrent_mixed_validation(
-    mock_factory: Any, mock_runtime: Any, mock_user_context: Any
+    mock_factory: Any, mock_runtime: Any, mock_user_context: Any, fresh_mcp: SandboxMCP
 ) -> None:
     """
     Simulate concurrent requests where some have valid IDs and some have invalid (empty) IDs.
     Ensure that invalid requests are rejected immediately without affecting valid sessions.
     """
-    mcp = SandboxMCP()
     valid_id = "valid_session"
 
     # Define tasks
     async def valid_req() -> str:
-        res = await mcp.execute_code(valid_id, "python", "pass", mock_user_context)
+        res = await fresh_mcp.execute_code(valid_id, "python", "pass", mock_user_context)
         return str(res["stdout"])
 
     async def invalid_req() -> None:
-        await mcp.execute_code("", "python", "pass", mock_user_context)
+        await fresh_mcp.execute_code("", "python", "pass", mock_user_context)
 
     # Run concurrently
     # We expect valid_req to succeed and invalid_req to raise ValueError
@@ -61,30 +41,27 @@ async def test_complex_concurrent_mixed_validation(
     await task_valid
 
     # Assert state
-    assert valid_id in mcp.sessions
-    assert len(mcp.sessions) == 1
-
-    await mcp.shutdown()
+    assert valid_id in fresh_mcp.sessions
+    assert len(fresh_mcp.sessions) == 1
 
 
-@pytest.mark.asyncio
-async def test_complex_rapid_lifecycle_mixed_ids(mock_factory: Any, mock_runtime: Any, mock_user_context: Any) -> None:
+async def test_complex_rapid_lifecycle_mixed_ids(
+    mock_factory: Any, mock_runtime: Any, mock_user_context: Any, fresh_mcp: SandboxMCP
+) -> None:
     """
     Simulate a client rapidly creating sessions, some with valid keys, some invalid.
     """
-    mcp = SandboxMCP()
-
     ids = ["valid1", "", "valid2", None, "valid3"]
 
-    results = []
-
-    for sid in ids:
-        try:
-            # type check: ignore for None
-            await mcp.execute_code(sid, "python", "pass", mock_user_context)  # type: ignore
-            results.append((sid, "success"))
-        except ValueError:
-            results.append((sid, "error"))
+    # Issue every request at once; invalid IDs surface as ValueError in their slot
+    outcomes = await asyncio.gather(
+        # type check: ignore for None
+        *(fresh_mcp.execute_code(sid, "python", "pass", mock_user_context) for sid in ids),  # type: ignore
+        return_exceptions=True,
+    )
+    results = [
+        (sid, "error" if isinstance(out, ValueError) else "success") for sid, out in zip(ids, outcomes, strict=True)
+    ]
 
     # verification
     assert results == [
@@ -95,9 +72,7 @@ async def test_complex_rapid_lifecycle_mixed_ids(mock_factory: Any, mock_runtime
         ("valid3", "success"),
     ]
 
-    assert len(mcp.sessions) == 3
-    assert "valid1" in mcp.sessions
-    assert "valid2" in mcp.sessions
-    assert "valid3" in mcp.sessions
-
-    await mcp.shutdown()
+    assert len(fresh_mcp.sessions) == 3
+    assert "valid1" in fresh_mcp.sessions
+    assert "valid2" in fresh_mcp.sessions
+    assert "valid3" in fresh_mcp.sessions
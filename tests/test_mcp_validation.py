@@ -3,16 +3,21 @@ from typing import Any
 import pytest
 from coreason_sandbox.mcp import SandboxMCP
 
+pytestmark = pytest.mark.usefixtures("no_reaper")
 
-@pytest.mark.asyncio
-async def test_mcp_validation_empty_session_id(mock_user_context: Any) -> None:
-    mcp = SandboxMCP()
 
+@pytest.mark.parametrize(
+    "call",
+    [
+        pytest.param(lambda mcp, ctx, sid: mcp.execute_code(sid, "python", "print(1)", ctx), id="execute_code"),
+        pytest.param(lambda mcp, ctx, sid: mcp.install_package(sid, "pandas", ctx), id="install_package"),
+        pytest.param(lambda mcp, ctx, sid: mcp.list_files(sid, ctx, "."), id="list_files"),
+    ],
+)
+# None is passed on purpose to check runtime safety beyond the type hints
+@pytest.mark.parametrize("session_id", ["", None], ids=["empty", "none"])
+async def test_mcp_validation_missing_session_id(
+    call: Any, session_id: str | None, mock_user_context: Any, mcp_instance: SandboxMCP
+) -> None:
     with pytest.raises(ValueError, match="Session ID is required"):
-        await mcp.execute_code("", "python", "print(1)", mock_user_context)
-
-    with pytest.raises(ValueError, match="Session ID is required"):
-        await mcp.install_package("", "pandas", mock_user_context)
-
-    with pytest.raises(ValueError, match="Session ID is required"):
-        await mcp.list_files("", mock_user_context, ".")
+        await call(mcp_instance, mock_user_context, session_id)
@@ -8,18 +8,31 @@
 #
 # Source Code: https://github.com/CoReason-AI/coreason_sandbox
 
+from typing import Any
+
 import pytest
 from coreason_sandbox.models import ExecutionResult, FileReference
 from pydantic import ValidationError
 
+# 1 MB of output, allocated once at import rather than per run
+_LARGE_STDOUT = "a" * 1_000_000
+
 
-def test_file_reference_creation() -> None:
-    ref = FileReference(filename="test.png", path="/tmp/test.png", content_type="image/png")
+@pytest.mark.parametrize(
+    "optional",
+    [
+        pytest.param({}, id="defaults"),
+        pytest.param({"content_type": "image/png"}, id="content_type"),
+        pytest.param({"size_bytes": 2048, "url": "https://bucket/test.png"}, id="size_and_url"),
+    ],
+)
+def test_file_reference_creation(optional: dict[str, Any]) -> None:
+    ref = FileReference(filename="test.png", path="/tmp/test.png", **optional)
     assert ref.filename == "test.png"
     assert ref.path == "/tmp/test.png"
-    assert ref.content_type == "image/png"
-    assert ref.size_bytes is None
-    assert ref.url is None
+    assert ref.content_type == optional.get("content_type")
+    assert ref.size_bytes == optional.get("size_bytes")
+    assert ref.url == optional.get("url")
 
 
 def test_execution_result_creation() -> None:
@@ -82,9 +95,8 @@ def test_edge_case_values() -> None:
     assert ref.path == ""
 
     # Large payload
-    large_stdout = "a" * 1_000_000
     result_large = ExecutionResult(
-        stdout=large_stdout,
+        stdout=_LARGE_STDOUT,
         stderr="",
         exit_code=0,
         artifacts=[],
@@ -93,9 +105,11 @@ def test_edge_case_values() -> None:
     assert len(result_large.stdout) == 1_000_000
 
 
-def test_execution_result_serialization() -> None:
-    ref = FileReference(filename="test.txt", path="/tmp/test.txt")
-    result = ExecutionResult(
+@pytest.fixture(scope="module")
+def sample_result() -> ExecutionResult:
+    # Only serialization is under test here, so skip validation on construction
+    ref = FileReference.model_construct(filename="test.txt", path="/tmp/test.txt")
+    return ExecutionResult.model_construct(
         stdout="ok",
         stderr="",
         exit_code=0,
@@ -103,12 +117,17 @@ def test_execution_result_serialization() -> None:
         execution_duration=0.1,
     )
 
+
+def test_execution_result_serialization(sample_result: ExecutionResult) -> None:
     # Verify dumping to dict
-    data = result.model_dump()
+    data = sample_result.model_dump()
     assert data["stdout"] == "ok"
     assert data["artifacts"][0]["filename"] == "test.txt"
 
     # Verify dumping to JSON
-    json_str = result.model_dump_json()
+    json_str = sample_result.model_dump_json()
     assert '"stdout":"ok"' in json_str
     assert '"filename":"test.txt"' in json_str
+
+    # Verify the JSON round-trips back to an equal model
+    assert ExecutionResult.model_validate_json(json_str) == sample_result
@@ -38,10 +38,10 @@ class MockRuntime(SandboxRuntime):
         # Simulate artifact generation
         artifacts = []
         if "plot" in code:
-            artifacts.append(FileReference(filename="plot.png", path="/tmp/plot.png"))
+            artifacts.append(FileReference.model_construct(filename="plot.png", path="/tmp/plot.png"))
             self.files.add("/tmp/plot.png")
 
-        return ExecutionResult(
+        return ExecutionResult.model_construct(
             stdout="executed",
             stderr="",
             exit_code=0,
@@ -79,7 +79,6 @@ class IncompleteRuntime(SandboxRuntime):
     pass
 
 
-@pytest.mark.asyncio
 async def test_runtime_instantiation(mock_user_context: Any) -> None:
     runtime = MockRuntime()
     assert isinstance(runtime, SandboxRuntime)
@@ -93,7 +92,6 @@ async def test_runtime_instantiation(mock_user_context: Any) -> None:
     await runtime.terminate()
 
 
-@pytest.mark.asyncio
 async def test_complex_workflow(mock_user_context: Any) -> None:
     """
     Simulate a full lifecycle:
@@ -130,7 +128,6 @@ async def test_complex_workflow(mock_user_context: Any) -> None:
     assert len(runtime.files) == 0
 
 
-@pytest.mark.asyncio
 async def test_runtime_state_enforcement(mock_user_context: Any) -> None:
     """Ensure operations fail if runtime is not started."""
     runtime = MockRuntime()
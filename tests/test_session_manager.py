@@ -9,32 +9,48 @@
 # Source Code: https://github.com/CoReason-AI/coreason_sandbox
 
 import asyncio
-from typing import Any
-from unittest.mock import AsyncMock, patch
+from typing import Any, AsyncGenerator, Callable
+from unittest.mock import AsyncMock
 
 import pytest
+import pytest_asyncio
 from coreason_identity.models import UserContext
 from coreason_sandbox.config import SandboxConfig
 from coreason_sandbox.session_manager import SessionManager
 
+# Tests synchronize on _cycle_event rather than the interval, so it only needs to be short
+TEST_REAPER_INTERVAL = 0.0005
 
-@pytest.fixture
-def mock_runtime() -> Any:
-    runtime = AsyncMock()
-    runtime.start = AsyncMock()
-    runtime.terminate = AsyncMock()
-    return runtime
+
+@pytest_asyncio.fixture
+async def make_manager(fake_clock: Any) -> AsyncGenerator[Callable[..., SessionManager], None]:
+    """Build SessionManagers on the fake clock; every one is shut down after the test."""
+    created: list[SessionManager] = []
+
+    def _make(config: SandboxConfig | None = None) -> SessionManager:
+        manager = SessionManager(config, clock=fake_clock)
+        created.append(manager)
+        return manager
+
+    yield _make
+    for manager in created:
+        await manager.shutdown()
 
 
 @pytest.fixture
-def mock_factory(mock_runtime: Any) -> Any:
-    with patch("coreason_sandbox.session_manager.SandboxFactory.get_runtime", return_value=mock_runtime) as mock:
-        yield mock
+def manager(make_manager: Callable[..., SessionManager]) -> SessionManager:
+    return make_manager()
 
 
-@pytest.mark.asyncio
-async def test_session_creation(mock_factory: Any, mock_runtime: Any, mock_user_context: Any) -> None:
-    manager = SessionManager()
+@pytest.fixture(scope="module")
+def other_user_context() -> UserContext:
+    """A second caller who does not own the sessions mock_user_context creates."""
+    return UserContext(user_id="other-user", email="other@example.com", scopes=[])
+
+
+async def test_session_creation(
+    mock_factory: Any, mock_runtime: Any, mock_user_context: Any, manager: SessionManager
+) -> None:
     session_id = "test_session"
 
     session = await manager.get_or_create_session(session_id, mock_user_context)
@@ -45,23 +61,19 @@ async def test_session_creation(mock_factory: Any, mock_runtime: Any, mock_user_
     assert session.owner_id == "test-user"
 
 
-@pytest.mark.asyncio
-async def test_session_creation_invalid_id(mock_user_context: Any) -> None:
-    manager = SessionManager()
+async def test_session_creation_invalid_id(mock_user_context: Any, manager: SessionManager) -> None:
     with pytest.raises(ValueError, match="Session ID is required"):
         await manager.get_or_create_session("", mock_user_context)
 
 
-@pytest.mark.asyncio
-async def test_session_creation_invalid_context() -> None:
-    manager = SessionManager()
+async def test_session_creation_invalid_context(manager: SessionManager) -> None:
     with pytest.raises(ValueError, match="UserContext is required"):
         await manager.get_or_create_session("sess", None)
 
 
-@pytest.mark.asyncio
-async def test_session_reuse(mock_factory: Any, mock_runtime: Any, mock_user_context: Any) -> None:
-    manager = SessionManager()
+async def test_session_reuse(
+    mock_factory: Any, mock_runtime: Any, mock_user_context: Any, manager: SessionManager
+) -> None:
     session_id = "test_session"
 
     # Create first time
@@ -74,59 +86,57 @@ async def test_session_reuse(mock_factory: Any, mock_runtime: Any, mock_user_con
     mock_runtime.start.assert_called_once()  # Should only be called once
 
 
-@pytest.mark.asyncio
-async def test_session_access_denied(mock_factory: Any, mock_runtime: Any, mock_user_context: Any) -> None:
-    manager = SessionManager()
+async def test_session_access_denied(
+    mock_factory: Any,
+    mock_runtime: Any,
+    mock_user_context: Any,
+    other_user_context: UserContext,
+    manager: SessionManager,
+) -> None:
     session_id = "test_session"
 
     # Create with user1
     await manager.get_or_create_session(session_id, mock_user_context)
 
-    # Try access with user2
-    other_context = UserContext(
-        user_id="other-user",
-        email="other@example.com",
-        scopes=[],
-    )
-
+    # Try access as another user
     with pytest.raises(PermissionError, match="does not belong to user"):
-        await manager.get_or_create_session(session_id, other_context)
+        await manager.get_or_create_session(session_id, other_user_context)
 
 
-@pytest.mark.asyncio
 async def test_session_creation_race_condition_access_denied(
-    mock_factory: Any, mock_runtime: Any, mock_user_context: Any
+    mock_factory: Any,
+    mock_runtime: Any,
+    mock_user_context: Any,
+    other_user_context: UserContext,
+    watched_lock: Any,
+    manager: SessionManager,
 ) -> None:
     """
     Test race condition where two users try to create the same session ID.
     User 1 gets the lock and creates it.
     User 2 waits for lock, then sees it created but with wrong owner.
     """
-    manager = SessionManager()
     session_id = "race_session"
 
-    # Define User 2 context
-    user2_context = UserContext(
-        user_id="user2",
-        email="user2@example.com",
-        scopes=[],
-    )
+    # Hold runtime.start open so task1 keeps the creation lock until released
+    entered = asyncio.Event()
+    proceed = asyncio.Event()
 
-    # Mock runtime.start to sleep slightly
-    async def slow_start() -> None:
-        await asyncio.sleep(0.1)
+    async def gated_start() -> None:
+        entered.set()
+        await proceed.wait()
 
-    mock_runtime.start.side_effect = slow_start
+    mock_runtime.start.side_effect = gated_start
+    manager._creation_lock = watched_lock
 
-    # Start both tasks roughly at same time
     task1 = asyncio.create_task(manager.get_or_create_session(session_id, mock_user_context))
+    await entered.wait()
 
-    # Slight delay to ensure task1 enters first and grabs lock
-    await asyncio.sleep(0.01)
+    task2 = asyncio.create_task(manager.get_or_create_session(session_id, other_user_context))
 
-    task2 = asyncio.create_task(manager.get_or_create_session(session_id, user2_context))
-
-    # Wait for results
+    # Let task1 finish only once task2 is queued behind it on the creation lock
+    await watched_lock.wait_for_waiters()
+    proceed.set()
     await task1
 
     # Task 2 should raise PermissionError
@@ -134,33 +144,35 @@ async def test_session_creation_race_condition_access_denied(
         await task2
 
 
-@pytest.mark.asyncio
 async def test_session_creation_race_condition_access_allowed(
-    mock_factory: Any, mock_runtime: Any, mock_user_context: Any
+    mock_factory: Any, mock_runtime: Any, mock_user_context: Any, watched_lock: Any, manager: SessionManager
 ) -> None:
     """
     Test race condition where two requests with SAME user try to create session.
     User 1 creates. User 2 waits for lock, then sees it created and succeeds.
     """
-    manager = SessionManager()
     session_id = "race_session_ok"
 
-    # Mock runtime.start to sleep slightly
-    async def slow_start() -> None:
-        await asyncio.sleep(0.1)
+    # Hold runtime.start open so task1 keeps the creation lock until released
+    entered = asyncio.Event()
+    proceed = asyncio.Event()
 
-    mock_runtime.start.side_effect = slow_start
+    async def gated_start() -> None:
+        entered.set()
+        await proceed.wait()
 
-    # Start both tasks roughly at same time
-    task1 = asyncio.create_task(manager.get_or_create_session(session_id, mock_user_context))
+    mock_runtime.start.side_effect = gated_start
+    manager._creation_lock = watched_lock
 
-    # Slight delay to ensure task1 enters first and grabs lock
-    await asyncio.sleep(0.01)
+    task1 = asyncio.create_task(manager.get_or_create_session(session_id, mock_user_context))
+    await entered.wait()
 
     # Same user context
     task2 = asyncio.create_task(manager.get_or_create_session(session_id, mock_user_context))
 
-    # Wait for results
+    # Let task1 finish only once task2 is queued behind it on the creation lock
+    await watched_lock.wait_for_waiters()
+    proceed.set()
     session1 = await task1
     session2 = await task2
 
@@ -169,80 +181,81 @@ async def test_session_creation_race_condition_access_allowed(
     mock_runtime.start.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_reaper_loop(mock_factory: Any, mock_runtime: Any, mock_user_context: Any) -> None:
-    # Config: Check every 0.01s, expire after 100s
-    config = SandboxConfig(idle_timeout=100.0, reaper_interval=0.01)
-    manager = SessionManager(config)
-
-    # Start time
-    start_time = 1000.0
+async def test_reaper_loop(
+    mock_factory: Any,
+    mock_runtime: Any,
+    mock_user_context: Any,
+    fake_clock: Any,
+    make_manager: Callable[..., SessionManager],
+) -> None:
+    # Config: Check as fast as the loop allows, expire after 100s
+    config = SandboxConfig(idle_timeout=100.0, reaper_interval=TEST_REAPER_INTERVAL)
+    manager = make_manager(config)
 
-    with patch("coreason_sandbox.session_manager.time.time", return_value=start_time):
-        await manager.get_or_create_session("expired_session", mock_user_context)
+    await manager.get_or_create_session("expired_session", mock_user_context)
 
     assert "expired_session" in manager.sessions
 
-    # Advance time beyond timeout (1000 + 100 + 1)
-    future_time = start_time + 150.0
-
-    with patch("coreason_sandbox.session_manager.time.time", return_value=future_time):
-        # Wait for reaper to cycle
-        await asyncio.sleep(0.05)
+    # Advance time beyond timeout
+    fake_clock.now += 150.0
 
-        # Session should be gone
-        assert "expired_session" not in manager.sessions
-        mock_runtime.terminate.assert_called_once()
+    # Wait for the next reaper pass
+    manager._cycle_event.clear()
+    await asyncio.wait_for(manager._cycle_event.wait(), 1.0)
 
-    await manager.shutdown()
+    # Session should be gone
+    assert "expired_session" not in manager.sessions
+    mock_runtime.terminate.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_reaper_loop_exception_handling(mock_factory: Any, mock_runtime: Any, mock_user_context: Any) -> None:
+async def test_reaper_loop_exception_handling(
+    mock_factory: Any,
+    mock_runtime: Any,
+    mock_user_context: Any,
+    fake_clock: Any,
+    session_logger: Any,
+    make_manager: Callable[..., SessionManager],
+) -> None:
     """Test that reaper loop survives exceptions during session termination."""
-    config = SandboxConfig(idle_timeout=0.1, reaper_interval=0.01)
-    manager = SessionManager(config)
+    config = SandboxConfig(idle_timeout=0.1)
+    manager = make_manager(config)
 
     # Setup a session that throws on terminate
     mock_runtime.terminate.side_effect = Exception("Terminate failed")
 
-    with patch("coreason_sandbox.session_manager.time.time", return_value=1000.0):
-        await manager.get_or_create_session("fail_session", mock_user_context)
+    await manager.get_or_create_session("fail_session", mock_user_context)
 
-    # Advance time to expire it
-    with patch("coreason_sandbox.session_manager.time.time", return_value=1100.0):
-        await asyncio.sleep(0.05)
+    # Advance time to expire it; the sweep must swallow the terminate error
+    fake_clock.now += 100.0
+    await manager._reap_once()
 
     # Session should still be removed from dict even if terminate failed
     assert "fail_session" not in manager.sessions
     mock_runtime.terminate.assert_called_once()
-
-    # Reaper should still be running (not crashed)
-    assert manager._reaper_task is not None
-    assert not manager._reaper_task.done()
-
-    await manager.shutdown()
+    session_logger.error.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_reaper_loop_crash_recovery() -> None:
+async def test_reaper_loop_crash_recovery(
+    monkeypatch: pytest.MonkeyPatch, session_logger: Any, make_manager: Callable[..., SessionManager]
+) -> None:
     """
     Test that if reaper loop logic itself crashes (top level), it is handled.
     """
-    manager = SessionManager(SandboxConfig(reaper_interval=0.01))
+    manager = make_manager(SandboxConfig(reaper_interval=TEST_REAPER_INTERVAL))
 
     # We want to verify the 'except Exception' block in _reaper_loop
-    # We can mock asyncio.sleep to raise Exception
-    with patch("asyncio.sleep", side_effect=[Exception("Crash"), asyncio.CancelledError()]):
-        # Start reaper manually to await it
-        await manager._reaper_loop()
+    # Stub this manager's reaper wait to raise Exception
+    crash = AsyncMock(side_effect=Exception("Crash"))
+    monkeypatch.setattr(manager, "_sleep", crash)
+    # Start reaper manually to await it
+    await manager._reaper_loop()
 
-    # The loop should have caught "Crash" and logged it, then caught CancelledError and exited.
+    # The loop should have caught "Crash", logged it and exited after a single wait
+    crash.assert_awaited_once()
+    session_logger.error.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_shutdown(mock_factory: Any, mock_runtime: Any, mock_user_context: Any) -> None:
-    manager = SessionManager()
+async def test_shutdown(mock_factory: Any, mock_runtime: Any, mock_user_context: Any, manager: SessionManager) -> None:
     await manager.get_or_create_session("s1", mock_user_context)
     await manager.get_or_create_session("s2", mock_user_context)
 
@@ -256,22 +269,23 @@ async def test_shutdown(mock_factory: Any, mock_runtime: Any, mock_user_context:
     assert manager._reaper_task is None
 
 
-@pytest.mark.asyncio
-async def test_shutdown_with_error(mock_factory: Any, mock_runtime: Any, mock_user_context: Any) -> None:
-    manager = SessionManager()
+async def test_shutdown_with_error(
+    mock_factory: Any, mock_runtime: Any, mock_user_context: Any, session_logger: Any, manager: SessionManager
+) -> None:
     await manager.get_or_create_session("s1", mock_user_context)
     mock_runtime.terminate.side_effect = Exception("Fail")
 
     await manager.shutdown()
 
     assert len(manager.sessions) == 0
-    # Should not raise
+    # Should not raise, only log
+    session_logger.error.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_runtime_start_failure(mock_factory: Any, mock_runtime: Any, mock_user_context: Any) -> None:
+async def test_runtime_start_failure(
+    mock_factory: Any, mock_runtime: Any, mock_user_context: Any, manager: SessionManager
+) -> None:
     """Verify that if runtime.start() fails, the session is not cached."""
-    manager = SessionManager()
     mock_runtime.start.side_effect = Exception("Start failed")
 
     with pytest.raises(Exception, match="Start failed"):
@@ -287,26 +301,26 @@ async def test_runtime_start_failure(mock_factory: Any, mock_runtime: Any, mock_
     assert "fail_start" in manager.sessions
 
 
-@pytest.mark.asyncio
-async def test_zero_idle_timeout(mock_factory: Any, mock_runtime: Any, mock_user_context: Any) -> None:
+async def test_zero_idle_timeout(
+    mock_factory: Any,
+    mock_runtime: Any,
+    mock_user_context: Any,
+    fake_clock: Any,
+    make_manager: Callable[..., SessionManager],
+) -> None:
     """Verify behavior when idle_timeout is 0 (immediate expiration)."""
     # Config: 0 timeout
-    config = SandboxConfig(idle_timeout=0.0, reaper_interval=0.01)
-    manager = SessionManager(config)
-
-    # Use real time mostly, but patch for control if needed
-    # If we insert a session, it is immediately expired.
+    config = SandboxConfig(idle_timeout=0.0)
+    manager = make_manager(config)
 
-    with patch("coreason_sandbox.session_manager.time.time", return_value=1000.0):
-        await manager.get_or_create_session("immediate_expire", mock_user_context)
+    # The clock is frozen, so the session survives until time moves at all
+    await manager.get_or_create_session("immediate_expire", mock_user_context)
 
     assert "immediate_expire" in manager.sessions
 
     # Advance time by minimal amount (e.g. 0.0001) which is > 0.0
-    with patch("coreason_sandbox.session_manager.time.time", return_value=1000.0001):
-        await asyncio.sleep(0.05)  # Wait for reaper
+    fake_clock.now += 0.0001
+    await manager._reap_once()
 
-        assert "immediate_expire" not in manager.sessions
-        mock_runtime.terminate.assert_called_once()
-
-    await manager.shutdown()
+    assert "immediate_expire" not in manager.sessions
+    mock_runtime.terminate.assert_called_once()
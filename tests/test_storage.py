@@ -1,18 +1,25 @@
 from pathlib import Path
-from typing import Any
-from unittest.mock import patch
+from typing import Any, Generator
+from unittest.mock import MagicMock, patch
 
 import pytest
 from botocore.exceptions import ClientError
 from coreason_sandbox.storage import S3Storage
 
 
-@pytest.fixture
-def mock_boto3() -> Any:
+@pytest.fixture(scope="module")
+def _patched_boto3() -> Generator[MagicMock, None, None]:
     with patch("coreason_sandbox.storage.boto3") as mock:
         yield mock
 
 
+@pytest.fixture
+def mock_boto3(_patched_boto3: MagicMock) -> MagicMock:
+    """boto3 as seen by S3Storage, patched once per module and reset for each test."""
+    _patched_boto3.reset_mock(return_value=True, side_effect=True)
+    return _patched_boto3
+
+
 def test_s3_storage_init(mock_boto3: Any) -> None:
     storage = S3Storage(bucket="my-bucket", region="us-east-1")
     mock_boto3.client.assert_called_with(
@@ -25,7 +32,6 @@ def test_s3_storage_init(mock_boto3: Any) -> None:
     assert storage.bucket == "my-bucket"
 
 
-@pytest.mark.asyncio
 async def test_s3_upload_success(mock_boto3: Any, tmp_path: Path, mock_user_context: Any) -> None:
     storage = S3Storage(bucket="my-bucket")
     mock_client = mock_boto3.client.return_value
@@ -42,14 +48,12 @@ async def test_s3_upload_success(mock_boto3: Any, tmp_path: Path, mock_user_cont
     assert url == "https://s3/url"
 
 
-@pytest.mark.asyncio
 async def test_s3_upload_file_not_found(mock_boto3: Any, mock_user_context: Any) -> None:
     storage = S3Storage(bucket="my-bucket")
     with pytest.raises(FileNotFoundError):
         await storage.upload_file(Path("nonexistent"), "key", mock_user_context, "sid")
 
 
-@pytest.mark.asyncio
 async def test_s3_upload_client_error(mock_boto3: Any, tmp_path: Path, mock_user_context: Any) -> None:
     storage = S3Storage(bucket="my-bucket")
     mock_client = mock_boto3.client.return_value